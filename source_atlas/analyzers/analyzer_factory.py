@@ -1,13 +1,40 @@
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from source_atlas.analyzers.base_analyzer import BaseCodeAnalyzer
 from source_atlas.analyzers.java_analyzer import JavaCodeAnalyzer
 
 from loguru import logger
 
+# Process-wide analyzer cache: building an analyzer sets up its LSP server, so reuse it for identical args.
+# Each analyzer holds a parser and tree caches, so only the most recently used ones are kept.
+_ANALYZER_CACHE_SIZE = 4
+_analyzer_cache: "OrderedDict[Tuple[str, Optional[str], Optional[str], Optional[str]], BaseCodeAnalyzer]" = OrderedDict()
+
 
 class AnalyzerFactory:
 
     @staticmethod
     def create_analyzer(language: str, root_path: str = None, project_id: str = None, branch: str = None):
+        key = (language.lower(), root_path, project_id, branch)
+        analyzer = _analyzer_cache.get(key)
+        if analyzer is not None:
+            _analyzer_cache.move_to_end(key)
+            logger.debug(f"Reusing cached analyzer for language: {language}, project_id: {project_id}, branch: {branch}")
+            return analyzer
+
         logger.info(f"Creating analyzer for language: {language}, project_id: {project_id}, branch: {branch}")
         if language.lower() == "java":
-            return JavaCodeAnalyzer(root_path, project_id, branch)
-        raise ValueError(f"Unsupported language: {language}")
+            analyzer = JavaCodeAnalyzer(root_path, project_id, branch)
+        else:
+            raise ValueError(f"Unsupported language: {language}")
+
+        _analyzer_cache[key] = analyzer
+        if len(_analyzer_cache) > _ANALYZER_CACHE_SIZE:
+            _analyzer_cache.popitem(last=False)
+        return analyzer
+
+    @staticmethod
+    def clear_cache() -> None:
+        """Drop all cached analyzers."""
+        _analyzer_cache.clear()
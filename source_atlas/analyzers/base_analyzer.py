@@ -1,21 +1,27 @@
-import hashlib
-import json
+import os
+import sys
 from abc import ABC, abstractmethod
+from bisect import bisect_left
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
+from multiprocessing import util
 from pathlib import Path
-from typing import List, Optional, Dict, Callable, Any
+from typing import List, Optional, Dict, Callable, FrozenSet, Iterable, Tuple, Type
 
 from loguru import logger
-from tree_sitter import Language, Parser, Node
+import xxhash
+from tree_sitter import Language, Parser, Node, Query, QueryCursor, Tree
 
 from source_atlas.lsp.lsp_service import LSPService
 from source_atlas.models.domain_models import CodeChunk, ChunkType
 from source_atlas.models.domain_models import Method
-from source_atlas.utils.common import convert, read_file_content
+from source_atlas.utils.common import DATACLASS_SLOTS, read_file_bytes, write_json_array
 from source_atlas.utils.lsp_utils import process_lsp_results
+from source_atlas.utils.tree_sitter_helper import compute_edit, extract_content
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ClassParsingContext:
     package: str
     class_name: str
@@ -26,32 +32,127 @@ class ClassParsingContext:
     import_mapping: Dict[str, str] = None
     parent_class: Optional[str] = None
     class_count: int = 1
-    parsed_tree: Optional[Any] = None
     file_path: Optional[str] = None
 
 
+@dataclass(**DATACLASS_SLOTS)
+class FileParsingContext:
+    package: str
+    import_mapping: Dict[str, str]
+    # class node start byte -> full class name, for the classes cached from this file
+    class_names_by_start: Dict[int, str]
+
+
+# Node types left out of compute_ast_hash, so comment/modifier-only edits keep the same hash
+_AST_HASH_SKIPPED_TYPES = frozenset({"comment", "block_comment", "line_comment", "modifiers"})
+_AST_HASH_MEMO_SIZE = 4096
+# Upper bound on the sources kept alive by reparse_file's tree cache; analyzers are reused across
+# runs (see AnalyzerFactory), so without it they would pin every file of every project they saw
+_TREE_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+# (language, query source) -> compiled query, shared by every analyzer instance in the process;
+# compiling costs far more than running a query
+_query_cache: Dict[Tuple[Language, str], Query] = {}
+
+# Per-process analyzer used by build_source_cache(parallel=True) workers
+_cache_worker: Optional["BaseCodeAnalyzer"] = None
+
+
+def _init_cache_worker(analyzer_cls: Type["BaseCodeAnalyzer"], args: tuple, kwargs: dict) -> None:
+    global _cache_worker
+    _cache_worker = analyzer_cls(*args, **kwargs)
+
+
+def _process_class_cache_file_in_worker(
+        file_path: Path) -> Tuple[Dict[str, "ClassParsingContext"], Optional["FileParsingContext"], Optional[str]]:
+    try:
+        cache_data = _cache_worker.process_class_cache_file(file_path)
+        return cache_data, _cache_worker._file_contexts.get(str(file_path)), None
+    except Exception as e:
+        return {}, None, str(e)
+    finally:
+        # Trees cannot be sent back to the parent process; don't keep them alive in the worker
+        _cache_worker._clear_tree_cache()
+        _cache_worker._file_contexts.clear()
+
+
+# Per-process analyzer used by parse_project(analysis_workers > 1) workers
+_analysis_worker: Optional["BaseCodeAnalyzer"] = None
+
+
+def _init_analysis_worker(analyzer_cls: Type["BaseCodeAnalyzer"], args: tuple, kwargs: dict,
+                          cached_nodes: Dict[str, "ClassParsingContext"], methods_cache: set,
+                          file_contexts: Dict[str, "FileParsingContext"]) -> None:
+    global _analysis_worker
+    _analysis_worker = analyzer_cls(*args, **kwargs)
+    _analysis_worker.cached_nodes = cached_nodes
+    _analysis_worker.methods_cache = methods_cache
+    _analysis_worker._file_contexts = file_contexts
+    # Each worker runs its own language server for the life of the process
+    if hasattr(_analysis_worker, "__enter__"):
+        _analysis_worker.__enter__()
+        util.Finalize(_analysis_worker, _analysis_worker.__exit__, args=(None, None, None), exitpriority=10)
+
+
+def _process_file_in_worker(file_path: Path) -> Tuple[List["CodeChunk"], Optional[str]]:
+    try:
+        return _analysis_worker.process_file(file_path), None
+    except Exception as e:
+        return [], str(e)
+    finally:
+        # Each file is analyzed once per run; don't keep its tree alive in the worker
+        _analysis_worker._forget_tree(str(file_path))
+
+
 class BaseCodeAnalyzer(ABC):
 
     def __init__(self, language: Language, parser: Parser, project_id: str, branch: str):
         self.language = language
         self.parser = parser
-        self.comment_remover = None
         self.project_id = project_id
         self.branch = branch
         self.cached_nodes = {}
         self.methods_cache = set()
+        # file path -> (raw content digest, parsed tree, decoded content, its UTF-8 bytes), see reparse_file;
+        # in LRU order and bounded by the size of the sources it holds
+        self._tree_cache: "OrderedDict[str, Tuple[bytes, Tree, str, bytes]]" = OrderedDict()
+        self._tree_cache_bytes = 0
+        # file path -> per-file package/imports/class names, filled by build_source_cache
+        self._file_contexts: Dict[str, FileParsingContext] = {}
         self.lsp_service: Optional[LSPService] = None
+        # Query source -> reusable cursor over the shared compiled query, see _query_captures
+        self._cursor_cache: Dict[str, QueryCursor] = {}
+        # (exact package names, "package." prefixes), built on first use by _get_builtin_filter
+        self._builtin_filter: Optional[Tuple[FrozenSet[str], Tuple[str, ...]]] = None
+        # (node type, source digest) -> AST hash, in LRU order; generated code and trivial
+        # methods (getters, setters) repeat the same source often
+        self._ast_hash_memo: "OrderedDict[Tuple[str, int], str]" = OrderedDict()
+        # (class node, comment start bytes, comment nodes) for the class being parsed, so its
+        # methods reuse the class's comment scan instead of each querying again, see _comments_in
+        self._comment_scope: Optional[Tuple[Node, List[int], List[Node]]] = None
+        # LSP path -> path relative to the project root (None outside it); LSP answers point
+        # into the same few files over and over, and resolve() hits the filesystem
+        self._relative_paths: Dict[str, Optional[str]] = {}
 
     def parse_project(self, root: Path, target_files: Optional[List[str]] = None, parse_all: bool = True,
-                      export_output: bool = True) -> List[CodeChunk]:
+                      export_output: bool = True, parallel: bool = False,
+                      analysis_workers: int = 1) -> List[CodeChunk]:
+        """
+        Analyze every source file under root (or only target_files) into code chunks.
+
+        parallel builds the source cache with a process pool. analysis_workers > 1 also
+        analyzes files in that many processes, each with its own language server (see
+        _get_analysis_worker_args); starting the servers only pays off on large projects.
+        """
         logger.info(f"Starting analysis for project '{self.project_id}' at {root}")
 
-        code_files = self._get_code_files(root)
-        if not code_files:
+        all_code_files = self._get_code_files(root)
+        if not all_code_files:
             logger.warning("No source files found")
             return []
 
         # Filter files if parse_all is False and target_files is provided
+        code_files = all_code_files
         if not parse_all and target_files:
             code_files = self._filter_files_by_targets(code_files, target_files)
 
@@ -62,18 +163,32 @@ class BaseCodeAnalyzer(ABC):
         logger.info(f"Found {len(code_files)} source files to process")
         chunks: List[CodeChunk] = []
 
-        # Build cache for all files (needed for cross-references)
-        self.build_source_cache(root)
-
-        # Process files sequentially (no threading for LSP compatibility)
-        logger.info("Processing files sequentially")
-        for i, file in enumerate(code_files, 1):
-            try:
-                file_chunks = self.process_file(file)
-                chunks.extend(file_chunks)
-                logger.debug(f"[{i}/{len(code_files)}] Completed processing: {file}")
-            except Exception as e:
-                logger.error(f"Error processing {file}: {e}", exc_info=True)
+        # Build cache for all files (needed for cross-references), reusing the directory walk above
+        self.build_source_cache(root, parallel=parallel, code_files=all_code_files)
+
+        worker_args = self._get_analysis_worker_args() if analysis_workers > 1 else None
+        if worker_args and len(code_files) > 1:
+            logger.info(f"Processing files with {analysis_workers} worker processes")
+            initargs = worker_args + (self.cached_nodes, self.methods_cache, self._file_contexts)
+            with ProcessPoolExecutor(max_workers=analysis_workers, initializer=_init_analysis_worker,
+                                     initargs=initargs) as executor:
+                results = executor.map(_process_file_in_worker, code_files, chunksize=8)
+                for i, (file, (file_chunks, error)) in enumerate(zip(code_files, results), 1):
+                    if error:
+                        logger.error("Error processing {}: {}", file, error)
+                        continue
+                    chunks.extend(file_chunks)
+                    logger.debug("[{}/{}] Completed processing: {}", i, len(code_files), file)
+        else:
+            # Process files sequentially (no threading for LSP compatibility)
+            logger.info("Processing files sequentially")
+            for i, file in enumerate(code_files, 1):
+                try:
+                    file_chunks = self.process_file(file)
+                    chunks.extend(file_chunks)
+                    logger.debug("[{}/{}] Completed processing: {}", i, len(code_files), file)
+                except Exception as e:
+                    self._log_file_error("processing", file, e)
 
         logger.info(f"Extracted {len(chunks)} code chunks total")
 
@@ -87,53 +202,53 @@ class BaseCodeAnalyzer(ABC):
 
     def process_file(self, file_path: Path) -> List[CodeChunk]:
         try:
-            content = read_file_content(file_path)
-            if not content.strip():
+            raw_content = read_file_bytes(file_path)
+            if not raw_content.strip() or not self._may_declare_types(raw_content):
                 return []
 
-            content = self.comment_remover.remove_comments(content)
+            # Reuses the tree from build_source_cache, or reparses incrementally if the file changed
+            tree, content = self.reparse_file(str(file_path), raw_content)
 
-            # Check if we have a cached tree for this file
-            tree = None
-            for context in self.cached_nodes.values():
-                if context.file_path == str(file_path) and context.parsed_tree is not None:
-                    tree = context.parsed_tree
-                    break
-            
-            # Parse tree only if not found in cache
-            if tree is None:
-                tree = self.parser.parse(bytes(content, 'utf8'))
-            
             class_nodes = self._extract_all_class_nodes(tree.root_node)
 
+            file_context = self._file_contexts.get(str(file_path))
+            if not file_context:
+                return []
+
             chunks = []
             for class_node in class_nodes:
-                chunk = self._parse_class_node(class_node, content, str(file_path), tree.root_node)
+                chunk = self._parse_class_node(class_node, content, str(file_path), file_context)
                 if chunk:
                     chunks.append(chunk)
             return chunks
 
         except Exception as e:
-            logger.error(f"Error processing file {file_path}: {e}", exc_info=True)
+            self._log_file_error("processing file", file_path, e)
             return []
 
-    def _parse_class_node(self, class_node: Node, content: str, file_path: str, root_node: Node) -> Optional[CodeChunk]:
+    def _parse_class_node(self, class_node: Node, content: str, file_path: str,
+                          file_context: FileParsingContext) -> Optional[CodeChunk]:
         try:
-            with self.lsp_service.open_file(file_path):
-                class_name = self._extract_class_name(class_node, content)
-                package = self._extract_package(root_node, content)
-                full_class_name = self._build_full_class_name(class_name, package, class_node, content, root_node)
-                context = self.cached_nodes.get(full_class_name)
-                if not context:
-                    return None
+            # Names were resolved during build_source_cache; don't re-walk the root node per class.
+            # Checked before opening the file so classes missing from the cache cost no LSP round-trip.
+            full_class_name = file_context.class_names_by_start.get(class_node.start_byte)
+            context = self.cached_nodes.get(full_class_name) if full_class_name else None
+            if not context:
+                return None
+
+            comment_query = self._get_comment_query()
+            if comment_query:
+                comments = self._comments_in(class_node, comment_query)
+                self._comment_scope = (class_node, [comment.start_byte for comment in comments], comments)
 
+            with self.lsp_service.open_file(file_path):
                 implements = []
                 if self._should_check_implements(class_node, content):
                     implements = self._extract_implements_with_lsp(class_node, file_path, content)
 
                 methods = self._extract_class_methods(
                     class_node, content, implements,context.full_class_name,
-                    file_path, context.import_mapping, class_name
+                    file_path, context.import_mapping, context.class_name
                 )
 
                 used_types = self.extract_class_use_types(class_node, content, file_path, context.import_mapping)
@@ -142,8 +257,8 @@ class BaseCodeAnalyzer(ABC):
                 annotations = self._extract_class_annotations(class_node, content, file_path, context.import_mapping)
                 handles_annotation = self._detect_annotation_handler(class_node, content, file_path, context.import_mapping, implements)
 
-                class_content = content[class_node.start_byte:class_node.end_byte]
-                ast_hash = self.compute_ast_hash(class_content)
+                class_content = self._extract_code(class_node, content)
+                ast_hash = self.compute_ast_hash(class_node)
 
                 return CodeChunk(
                     package=context.package,
@@ -153,7 +268,7 @@ class BaseCodeAnalyzer(ABC):
                     content=class_content,
                     ast_hash=ast_hash,
                     implements=implements,
-                    methods=methods,
+                    methods=tuple(methods),
                     is_nested=context.is_nested,
                     parent_class=context.parent_class,
                     type=ChunkType.CONFIGURATION if context.is_config else ChunkType.REGULAR,
@@ -167,19 +282,20 @@ class BaseCodeAnalyzer(ABC):
         except Exception as e:
             logger.error(f"Error parsing class node: {e}")
             return None
+        finally:
+            self._comment_scope = None
 
-    def _build_class_context(self, class_node: Node, content: str, root_node: Node) -> Optional[ClassParsingContext]:
+    def _build_class_context(self, class_node: Node, content: str, root_node: Node, package: str,
+                             import_mapping: Dict[str, str]) -> Optional[ClassParsingContext]:
         class_name = self._extract_class_name(class_node, content)
-        logger.info(f"class_name {class_name}")
+        logger.debug("class_name {}", class_name)
         if not class_name:
             return None
 
-        package = self._extract_package(root_node, content)
         is_nested = self._is_nested_class(class_node, root_node)
         full_class_name = self._build_full_class_name(class_name, package, class_node, content, root_node)
-        parent_class = self._get_parent_class(class_node, content, package) if is_nested else None,
+        parent_class = self._get_parent_class(class_node, content, package) if is_nested else None
         is_config = self._is_config_node(class_node, content)
-        import_mapping = self.build_import_mapping(root_node, content)
         
         # Extract and cache method names for this class
         methods = self._extract_all_method_names_from_class(class_node, content, full_class_name)
@@ -196,6 +312,13 @@ class BaseCodeAnalyzer(ABC):
             methods=methods
         )
 
+    @staticmethod
+    def _log_file_error(action: str, file_path, error: Exception) -> None:
+        # One line per failing file; the traceback is only formatted when DEBUG is enabled,
+        # since a broken dependency can make thousands of files fail the same way
+        logger.error("Error {} {}: {}", action, file_path, error)
+        logger.opt(exception=error).debug("Traceback for {}", file_path)
+
     def export_chunks(self, chunks: List[CodeChunk], output_path: Path) -> None:
         """Export chunks to JSON file"""
         if not chunks:
@@ -205,53 +328,66 @@ class BaseCodeAnalyzer(ABC):
         logger.info(f"Exporting {len(chunks)} chunks to {output_path}")
         output_path.mkdir(parents=True, exist_ok=True)
         
-        chunks_data = [convert(c) for c in chunks]
         chunks_file = output_path / "chunks.json"
-        
-        with open(chunks_file, "w", encoding="utf-8") as f:
-            json.dump(chunks_data, f, indent=2, ensure_ascii=False)
+        write_json_array(chunks, chunks_file)
         
         logger.info(f"✅ Exported {len(chunks)} chunks to: {chunks_file}")
 
-    def compute_ast_hash(self, code: str) -> str:
+    def compute_ast_hash(self, node: Node) -> str:
         """
-        Compute AST hash for Java code using Tree-sitter.
-        This method is specific to Java and uses the existing parser.
+        Compute AST hash of an already parsed class or method node.
+
+        Walks the node in place instead of re-parsing its source. Results are memoized
+        by node type and a digest of the source text, so repeated bodies are hashed once
+        without the memo holding on to their text.
         """
         try:
-            tree = self.parser.parse(bytes(code, "utf8"))
-            root = tree.root_node
-
-            def walk_ast(node):
-                """Walk the AST and create a structural representation"""
-                # Skip comments and whitespace nodes
-                if node.type in ("comment", "block_comment", "line_comment", "line_comment", "modifiers"):
-                    return ""
-
-                # For leaf nodes, include the type but not the content
-                if not node.children:
-                    return f"{node.type}"
-
-                # For internal nodes, include type and children
-                children_repr = []
-                for child in node.children:
-                    child_repr = walk_ast(child)
-                    if child_repr:  # Only include non-empty children
-                        children_repr.append(child_repr)
-
-                if children_repr:
-                    return f"{node.type}({','.join(children_repr)})"
-                else:
-                    return f"{node.type}"
-
-            ast_repr = walk_ast(root)
-            return hashlib.sha256(ast_repr.encode()).hexdigest()
+            key = (node.type, xxhash.xxh3_128_intdigest(node.text))
+            ast_hash = self._ast_hash_memo.get(key)
+            if ast_hash is not None:
+                self._ast_hash_memo.move_to_end(key)
+                return ast_hash
+
+            ast_hash = self._hash_node(node)
+            self._ast_hash_memo[key] = ast_hash
+            if len(self._ast_hash_memo) > _AST_HASH_MEMO_SIZE:
+                self._ast_hash_memo.popitem(last=False)
+            return ast_hash
 
         except Exception as e:
-            logger.debug(f"Error computing Java AST hash, falling back to normalized hash: {e}")
-            # Fallback to normalized content hash
-            return hashlib.sha256(code.encode()).hexdigest()
+            logger.debug(f"Error computing AST hash, falling back to content hash: {e}")
+            return xxhash.xxh3_128_hexdigest(node.text or b"")
 
+    @staticmethod
+    def _hash_node(root: Node) -> str:
+        """
+        Hash the structure under root, ignoring comments and modifiers.
+
+        The structure is collected with an iterative DFS as type(child,child,...) with
+        comment and modifier nodes skipped, so deep trees cannot hit the recursion limit,
+        then hashed in one XXH3 call rather than one hasher update per fragment.
+        """
+        parts = []
+        stack = [root]
+        while stack:
+            item = stack.pop()
+            if isinstance(item, bytes):
+                parts.append(item)
+                continue
+            if item.type in _AST_HASH_SKIPPED_TYPES:
+                continue
+
+            parts.append(item.type.encode())
+            children = [child for child in item.children if child.type not in _AST_HASH_SKIPPED_TYPES]
+            if children:
+                parts.append(b"(")
+                stack.append(b")")
+                # Pushed in reverse so children pop in source order, comma-separated
+                for i, child in enumerate(reversed(children)):
+                    if i:
+                        stack.append(b",")
+                    stack.append(child)
+        return xxhash.xxh3_128_hexdigest(b"".join(parts))
 
     @abstractmethod
     def _get_code_files(self, root: Path) -> List[Path]:
@@ -315,7 +451,7 @@ class BaseCodeAnalyzer(ABC):
         pass
 
     @abstractmethod
-    def _get_builtin_packages(self) -> List[str]:
+    def _get_builtin_packages(self) -> Iterable[str]:
         pass
 
     @abstractmethod
@@ -331,13 +467,77 @@ class BaseCodeAnalyzer(ABC):
     def _is_annotation_declaration(self, node: Node) -> bool:
         return False
 
+    def _get_cache_worker_args(self) -> Optional[Tuple[type, tuple, dict]]:
+        """
+        Return (analyzer class, args, kwargs) used to build an LSP-less analyzer in each
+        build_source_cache worker process, or None if this analyzer cannot run in parallel.
+        """
+        return None
+
+    def _get_analysis_worker_args(self) -> Optional[Tuple[type, tuple, dict]]:
+        """
+        Return (analyzer class, args, kwargs) used to build a full analyzer, language server
+        included, in each parse_project worker process, or None to always analyze serially.
+        """
+        return None
+
+    def _get_comment_query(self) -> Optional[str]:
+        """Tree-sitter query capturing comment nodes, spliced out by _extract_code; None keeps them."""
+        return None
+
+    def _extract_code(self, node: Node, content: str) -> str:
+        """Source text of node with its comment nodes removed."""
+        comment_query = self._get_comment_query()
+        if not comment_query:
+            return extract_content(node, content)
+
+        comments = self._comments_in(node, comment_query)
+        if not comments:
+            return extract_content(node, content)
+
+        # Splice between comment byte ranges; only touches the comments, not every node.
+        # Each comment leaves a space behind, so `int/*x*/f` doesn't become `intf`.
+        text, offset, position, pieces = node.text, node.start_byte, 0, []
+        for comment in comments:
+            pieces.append(text[position:comment.start_byte - offset])
+            position = comment.end_byte - offset
+        pieces.append(text[position:])
+        return b" ".join(pieces).decode("utf-8")
+
+    def _comments_in(self, node: Node, comment_query: str) -> List[Node]:
+        """Comment nodes under node in source order, sliced from the current class's scan when possible."""
+        scope = self._comment_scope
+        if scope is not None:
+            scope_node, starts, comments = scope
+            if node == scope_node:
+                return comments
+            # Members sit in the class body, so their grandparent is the class
+            parent = node.parent
+            if parent is not None and parent.parent == scope_node:
+                first = bisect_left(starts, node.start_byte)
+                return comments[first:bisect_left(starts, node.end_byte, first)]
+
+        captures = self._query_captures(comment_query, node)
+        return sorted((comment for nodes in captures.values() for comment in nodes), key=lambda n: n.start_byte)
+
+    def _get_type_declaration_keywords(self) -> Tuple[bytes, ...]:
+        """Byte strings at least one of which appears in any file declaring a type; empty disables the prefilter."""
+        return ()
+
+    def _may_declare_types(self, raw_content: bytes) -> bool:
+        # Checked on the bytes already read for parsing, before any decoding or tree-sitter work
+        keywords = self._get_type_declaration_keywords()
+        if not keywords:
+            return True
+        return any(keyword in raw_content for keyword in keywords)
+
     # Concrete methods for reusability across language analyzers
 
     def filter_builtin_items(self, items: list) -> list:
         from source_atlas.config.java_constants import JavaBuiltinPackages
         
         filtered, seen = [], set()
-        builtin_packages = self._get_builtin_packages()
+        builtin_packages, builtin_prefixes = self._get_builtin_filter()
 
         for item in items:
             # Extract name from object or use string directly
@@ -353,7 +553,7 @@ class BaseCodeAnalyzer(ABC):
                 continue
 
             # Filter builtin packages
-            if any(name.startswith(pkg + ".") or name == pkg for pkg in builtin_packages):
+            if name in builtin_packages or name.startswith(builtin_prefixes):
                 continue
 
             # Filter invalid content paths
@@ -362,16 +562,30 @@ class BaseCodeAnalyzer(ABC):
 
             # Avoid duplicates
             if name not in seen:
-                filtered.append(item)
+                # The same qualified names recur across thousands of methods; keep one copy of each
+                filtered.append(sys.intern(item) if item is name else item)
                 seen.add(name)
 
         return filtered
 
+    def _get_builtin_filter(self) -> Tuple[FrozenSet[str], Tuple[str, ...]]:
+        # str.startswith(tuple) checks every prefix in C instead of a Python-level any()
+        if self._builtin_filter is None:
+            packages = self._get_builtin_packages()
+            self._builtin_filter = (frozenset(packages), tuple(f"{pkg}." for pkg in sorted(packages)))
+        return self._builtin_filter
+
     def _get_absolute_path(self, absolute_path: str) -> str:
         if not absolute_path or not isinstance(absolute_path, str):
             logger.debug(f"Invalid absolute_path: {absolute_path}")
             return None
 
+        if absolute_path in self._relative_paths:
+            return self._relative_paths[absolute_path]
+        relative = self._relative_paths[absolute_path] = self._relative_to_project_root(absolute_path)
+        return relative
+
+    def _relative_to_project_root(self, absolute_path: str) -> Optional[str]:
         abs_path = Path(absolute_path).resolve()
         root = Path(self.project_root).resolve()
 
@@ -429,58 +643,191 @@ class BaseCodeAnalyzer(ABC):
         if not target_files:
             return code_files
             
-        filtered_files = []
-        for code_file in code_files:
-            code_file_str = str(code_file).replace('\\', '/')
-            # Check if any target file path matches the end of this code file
-            for target in target_files:
-                target_normalized = target.replace('\\', '/')
-                if code_file_str.endswith(target_normalized):
-                    filtered_files.append(code_file)
-                    break
-        
+        # Normalized once; str.endswith(tuple) checks every target in a single C call
+        target_suffixes = tuple(target.replace('\\', '/') for target in target_files)
+        filtered_files = [
+            code_file for code_file in code_files
+            if str(code_file).replace('\\', '/').endswith(target_suffixes)
+        ]
+
         logger.info(f"Filtered to {len(filtered_files)} files based on target_files")
         return filtered_files
 
-    def build_source_cache(self, root) -> Dict[str, ClassParsingContext]:
-        # Get all code files and filter by target_files if provided
-        code_files = self._get_code_files(root)
-        cached_nodes = {}
+    def build_source_cache(self, root, parallel: bool = False, max_workers: Optional[int] = None,
+                           code_files: Optional[List[Path]] = None) -> Dict[str, ClassParsingContext]:
+        """
+        Build class contexts for every source file.
+
+        This phase only uses tree-sitter, so with parallel=True files are processed by a
+        process pool of LSP-less analyzers (see _get_cache_worker_args). Trees are not
+        shared back, so process_file parses each file again in that mode.
 
-        # Process cache building sequentially (no threading for LSP compatibility)
-        logger.info("Building source cache sequentially")
-        for i, file in enumerate(code_files, 1):
-            try:
-                cache_data = self.process_class_cache_file(file)
-                cached_nodes.update(cache_data)
-                logger.debug(f"[{i}/{len(code_files)}] Cached: {file}")
-            except Exception as e:
-                logger.error(f"Error caching {file}: {e}", exc_info=True)
+        code_files defaults to every source file under root; pass it when the tree
+        has already been walked.
+        """
+        if code_files is None:
+            code_files = self._get_code_files(root)
+        cached_nodes = {}
+        # Analyzers can be reused across runs; start from clean method-name and file caches
+        self.methods_cache = set()
+        self._file_contexts = {}
+
+        worker_args = self._get_cache_worker_args() if parallel else None
+        if worker_args and len(code_files) > 1:
+            max_workers = max_workers or os.cpu_count() or 1
+            logger.info(f"Building source cache with {max_workers} worker processes")
+            with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_cache_worker,
+                                     initargs=worker_args) as executor:
+                results = executor.map(_process_class_cache_file_in_worker, code_files, chunksize=16)
+                for i, (file, (cache_data, file_context, error)) in enumerate(zip(code_files, results), 1):
+                    if error:
+                        logger.error("Error caching {}: {}", file, error)
+                        continue
+                    cached_nodes.update(cache_data)
+                    if file_context:
+                        self._file_contexts[str(file)] = file_context
+                    for context in cache_data.values():
+                        self.methods_cache.update(context.methods)
+                    logger.debug("[{}/{}] Cached: {}", i, len(code_files), file)
+        else:
+            # Process cache building sequentially (no threading for LSP compatibility)
+            logger.info("Building source cache sequentially")
+            for i, file in enumerate(code_files, 1):
+                try:
+                    cache_data = self.process_class_cache_file(file)
+                    cached_nodes.update(cache_data)
+                    logger.debug("[{}/{}] Cached: {}", i, len(code_files), file)
+                except Exception as e:
+                    self._log_file_error("caching", file, e)
 
         self.cached_nodes = cached_nodes
         logger.info(f"Cache built with {len(cached_nodes)} classes")
         return cached_nodes
 
     def process_class_cache_file(self, file_path) -> Dict[str, ClassParsingContext]:
-        content = read_file_content(file_path)
-        if not content.strip():
+        raw_content = read_file_bytes(file_path)
+        if not raw_content.strip() or not self._may_declare_types(raw_content):
             return {}
 
-        content = self.comment_remover.remove_comments(content)
-
-        tree = self.parser.parse(bytes(content, 'utf8'))
+        file_path_str = str(file_path)
+        tree, content = self.reparse_file(file_path_str, raw_content)
         class_nodes = self._extract_all_class_nodes(tree.root_node)
-        
+        if not class_nodes:
+            return {}
+
+        # Package and imports are per file; resolve them once rather than once per class
+        package = self._extract_package(tree.root_node, content)
+        import_mapping = self.build_import_mapping(tree.root_node, content)
+        file_context = FileParsingContext(package=package, import_mapping=import_mapping, class_names_by_start={})
+
         chunks = {}
         class_count = len(class_nodes)
-        file_path_str = str(file_path)
         
         for class_node in class_nodes:
-            context = self._build_class_context(class_node, content, tree.root_node)
+            context = self._build_class_context(class_node, content, tree.root_node, package, import_mapping)
             if context:
-                # Store tree, class count, and file path for performance optimization
-                context.parsed_tree = tree
+                # Store class count and file path for performance optimization
                 context.class_count = class_count
                 context.file_path = file_path_str
                 chunks[context.full_class_name] = context
+                file_context.class_names_by_start[class_node.start_byte] = context.full_class_name
+
+        self._file_contexts[file_path_str] = file_context
         return chunks
+
+    def reparse_file(self, file_path: str, raw_content: bytes) -> Tuple[Tree, str]:
+        """
+        Parse the raw content of file_path, reusing what is cached for that path.
+
+        Unchanged content returns the cached tree as is, without decoding anything.
+        Changed content is parsed straight from bytes, incrementally against the previous tree (tree.edit + old-tree reuse), falling
+        back to a full parse if the incremental result has errors the previous tree did not.
+
+        Returns:
+            Tuple of (tree, decoded content)
+        """
+        digest = self._content_digest(raw_content)
+        cached = self._tree_cache.get(file_path)
+        if cached and cached[0] == digest:
+            self._tree_cache.move_to_end(file_path)
+            return cached[1], cached[2]
+
+        # Parsed as is: comments become nodes, which hashing skips and _extract_code splices out
+        source = raw_content
+        try:
+            content = source.decode('utf-8')
+        except UnicodeDecodeError:
+            # Not UTF-8: fall back to latin1, which decodes any bytes; tree-sitter needs UTF-8 bytes
+            content = source.decode('latin1')
+            source = content.encode('utf-8')
+
+        tree = self._parse_source(source, (cached[1], cached[3]) if cached else None)
+        self._remember_tree(file_path, (digest, tree, content, source))
+        return tree, content
+
+    def _remember_tree(self, file_path: str, entry: Tuple[bytes, Tree, str, bytes]):
+        self._forget_tree(file_path)
+        self._tree_cache[file_path] = entry
+        self._tree_cache_bytes += len(entry[2]) + len(entry[3])
+        # The entry just stored is the most recent one and is always kept
+        while self._tree_cache_bytes > _TREE_CACHE_MAX_BYTES and len(self._tree_cache) > 1:
+            self._forget_tree(next(iter(self._tree_cache)))
+
+    def _forget_tree(self, file_path: str):
+        entry = self._tree_cache.pop(file_path, None)
+        if entry is not None:
+            self._tree_cache_bytes -= len(entry[2]) + len(entry[3])
+
+    def _clear_tree_cache(self):
+        self._tree_cache.clear()
+        self._tree_cache_bytes = 0
+
+    def _parse_source(self, source: bytes, previous: Optional[Tuple[Tree, bytes]] = None) -> Tree:
+        """
+        Parse source, incrementally against a previous (tree, source) pair when given.
+
+        The previous tree is edited in place, so it must not be used afterwards. A full parse is
+        only retried when the edit introduced errors; a file that already had them keeps the incremental tree.
+        """
+        if previous:
+            old_tree, old_source = previous
+            old_had_error = old_tree.root_node.has_error
+            old_tree.edit(**compute_edit(old_source, source))
+            tree = self.parser.parse(source, old_tree)
+            if old_had_error or not tree.root_node.has_error:
+                return tree
+        return self.parser.parse(source)
+
+    def _get_or_create_query(self, query_string: str) -> Query:
+        key = (self.language, query_string)
+        query = _query_cache.get(key)
+        if query is None:
+            query = _query_cache[key] = Query(self.language, query_string)
+        return query
+
+    def _query_captures(self, query_string: str, node: Node) -> dict:
+        """Execute tree-sitter query and return captures."""
+        try:
+            # captures() materializes its results, so one cursor per query can be reused
+            cursor = self._cursor_cache.get(query_string)
+            if cursor is None:
+                cursor = self._cursor_cache[query_string] = QueryCursor(self._get_or_create_query(query_string))
+            return cursor.captures(node)
+        except Exception as e:
+            logger.debug(f"Query execution failed for query '{query_string[:50]}...': {e}")
+            return {}
+
+    def _query_matches(self, query_string: str, node: Node) -> list:
+        """Execute tree-sitter query and return its matches as (pattern index, captures) pairs."""
+        try:
+            cursor = self._cursor_cache.get(query_string)
+            if cursor is None:
+                cursor = self._cursor_cache[query_string] = QueryCursor(self._get_or_create_query(query_string))
+            return cursor.matches(node)
+        except Exception as e:
+            logger.debug(f"Query execution failed for query '{query_string[:50]}...': {e}")
+            return []
+
+    @staticmethod
+    def _content_digest(content: bytes) -> bytes:
+        return xxhash.xxh3_128_digest(content)
@@ -1,24 +1,175 @@
 import re
+import sys
 from abc import ABC
+from collections import OrderedDict
 from dataclasses import dataclass
 from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional, Tuple, Dict
+from typing import List, Optional, Tuple, Dict, FrozenSet
 
 from loguru import logger
-from tree_sitter import Language, Parser, Node, Query, QueryCursor
+from tree_sitter import Language, Parser, Node, Tree
 from tree_sitter_language_pack import get_language
 
-from source_atlas.analyzers.base_analyzer import BaseCodeAnalyzer
+from source_atlas.analyzers.base_analyzer import BaseCodeAnalyzer, ClassParsingContext
 from source_atlas.config.java_constants import JavaBuiltinPackages, JavaParsingConstants, JavaCodeAnalyzerConstant
 from source_atlas.extractors.java.java_extractor import JavaEndpointExtractor
 from source_atlas.lsp.lsp_service import LSPService
+from source_atlas.lsp.multilspy.multilspy_utils import PathUtils
 from source_atlas.models.domain_models import Method, MethodCall, ChunkType
-from source_atlas.utils.comment_remover import JavaCommentRemover
-from source_atlas.utils.common import normalize_whitespace
+from source_atlas.utils.common import find_files, normalize_whitespace, read_file_bytes
 from source_atlas.utils.tree_sitter_helper import extract_content
 
 
+# Maven/Gradle source root, as it appears in dotted relative paths
+_SOURCE_DIRECTORY_PREFIX = "src.main.java."
+# Upper bound on memoized LSP answers, keyed by (request, file, line, column)
+_LSP_CACHE_SIZE = 200_000
+# Upper bound on parsed trees kept for files that LSP answers point into
+_TARGET_TREE_CACHE_SIZE = 256
+# Upper bound on cached file contents, by size rather than count so a few huge generated files can't exhaust memory
+_FILE_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+_METHOD_INVOCATION_QUERY = """
+    [
+      (method_invocation
+        object: (_) @object
+        name: (identifier) @method_name
+        arguments: (argument_list)? @arguments
+      ) @call
+
+      (method_invocation
+        name: (identifier) @method_name
+        arguments: (argument_list)? @arguments
+      ) @call
+    ]
+"""
+
+_USED_TYPE_QUERY = """
+    (local_variable_declaration type: (_) @var_type)
+    (method_declaration type: (_) @return_type)
+    (formal_parameter type: (_) @param_type)
+    (spread_parameter (type_identifier) @varargs_type)
+    (type_arguments (_) @generic_type)
+    (array_type element: (_) @array_element_type)
+    (scoped_type_identifier) @first_scoped
+    (#not-ancestor? @first_scoped scoped_type_identifier)
+"""
+
+_FIELD_ACCESS_QUERY = """
+    (field_access field: (_) @field_name)
+"""
+
+# Hover text of a method: "[annotations] ReturnType[<..>][[]] pkg.Class.method(", see _resolve_class_from_hover
+_HOVER_SIGNATURE_RE = re.compile(
+    r"""^(?P<return>(?:@\w+(?:\([^)]*\))?\s+)*
+        (?:[\w$.]+)
+        (?:<[^>]+>+)?
+        (?:\[\])*
+    )\s+
+    (?P<class>[\w$.]+)\.(?P<method>\w+)\(""",
+    re.VERBOSE,
+)
+
+
+# Signatures of common library methods repeat thousands of times per project
+@lru_cache(maxsize=4096)
+def _class_from_hover_signature(signature: str) -> Optional[str]:
+    m = _HOVER_SIGNATURE_RE.match(signature.strip())
+    return m.group('class') if m else None
+
+
+# Capture-name prefixes of the fused per-method query, see _query_method_dependencies
+_METHOD_CALL_PREFIX = "mc_"
+_USED_TYPE_PREFIX = "ut_"
+_FIELD_ACCESS_PREFIX = "fa_"
+
+
+def _prefix_captures(query: str, prefix: str) -> str:
+    return re.sub(r"@(\w+)", rf"@{prefix}\1", query)
+
+
+# Used-type captures whose nodes name a type to resolve
+_USED_TYPE_CAPTURES = frozenset({
+    "var_type", "return_type", "param_type", "varargs_type",
+    "generic_type", "array_element_type", "first_scoped",
+})
+
+
+# One query for all three per-method lookups, so each method body is traversed once
+_METHOD_DEPENDENCY_QUERY = "\n".join((
+    _prefix_captures(_METHOD_INVOCATION_QUERY, _METHOD_CALL_PREFIX),
+    _prefix_captures(_USED_TYPE_QUERY, _USED_TYPE_PREFIX),
+    _prefix_captures(_FIELD_ACCESS_QUERY, _FIELD_ACCESS_PREFIX),
+))
+
+
+class _FileCache:
+    """
+    Raw, decoded and line-split contents per file path, in LRU order.
+
+    Each form is materialized on first use and charged at the raw size; least recently
+    used files are dropped once the total goes over max_bytes.
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self.reads = 0
+        # file path -> [raw bytes, decoded text, lines, charged size]
+        self._entries: "OrderedDict[str, list]" = OrderedDict()
+
+    def read_bytes(self, file_path: str) -> Optional[bytes]:
+        return self._entry(file_path)[0]
+
+    def read_text(self, file_path: str) -> Optional[str]:
+        entry = self._entry(file_path)
+        if entry[1] is None and entry[0] is not None:
+            try:
+                entry[1] = entry[0].decode('utf-8')
+            except UnicodeDecodeError as e:
+                logger.debug(f"Error decoding file {file_path}: {e}")
+                return None
+            self._charge(entry, len(entry[0]))
+        return entry[1]
+
+    def read_lines(self, file_path: str) -> Tuple[str, ...]:
+        entry = self._entry(file_path)
+        if entry[2] is None:
+            content = self.read_text(file_path)
+            entry[2] = tuple(content.split('\n')) if content else ()
+            self._charge(entry, len(entry[0] or b""))
+        return entry[2]
+
+    def clear(self):
+        self._entries.clear()
+        self.total_bytes = 0
+
+    def _entry(self, file_path: str) -> list:
+        entry = self._entries.get(file_path)
+        if entry is not None:
+            self._entries.move_to_end(file_path)
+            return entry
+        self.reads += 1
+        try:
+            raw_content = read_file_bytes(Path(file_path))
+        except OSError as e:
+            logger.debug(f"Error reading file {file_path}: {e}")
+            raw_content = None
+        entry = [raw_content, None, None, 0]
+        self._entries[file_path] = entry
+        self._charge(entry, len(raw_content or b""))
+        return entry
+
+    def _charge(self, entry: list, size: int):
+        entry[3] += size
+        self.total_bytes += size
+        # The entry being charged is the most recent one and is always kept
+        while self.total_bytes > self.max_bytes and len(self._entries) > 1:
+            _, evicted = self._entries.popitem(last=False)
+            self.total_bytes -= evicted[3]
+
+
 @dataclass
 class MethodDependencies:
     method_calls: List[str]
@@ -27,56 +178,156 @@ class MethodDependencies:
 
 
 class JavaCodeAnalyzer(BaseCodeAnalyzer, ABC):
-    def __init__(self, root_path: str = None, project_id: str = None, branch: str = None):
+    def __init__(self, root_path: str = None, project_id: str = None, branch: str = None, use_lsp: bool = True):
         language: Language = get_language("java")
         parser = Parser(language)
         super().__init__(language, parser, project_id, branch)
 
+        # Node kind ids of type declarations: an int membership test on hot ancestor walks,
+        # where node.type would build a new str per node
+        self._class_kind_ids: FrozenSet[int] = frozenset(
+            kind_id for kind_id in range(language.node_kind_count)
+            if language.node_kind_is_named(kind_id)
+            and language.node_kind_for_id(kind_id) in JavaParsingConstants.CLASS_NODE_TYPES
+        )
+
         # Services
-        self.comment_remover = JavaCommentRemover()
         self.endpoint_extractor = JavaEndpointExtractor()
-        self.lsp_service = LSPService.create(root_path)
+        # Cache-building workers only need tree-sitter and skip the language server
+        self.lsp_service = LSPService.create(root_path) if use_lsp else None
+        self._root_path = root_path
         self.project_id = project_id
         self.branch = branch
         self._server_ctx = None
+        self._server_refcount = 0
         self.project_root = Path(root_path).resolve() if root_path else None
-
-        # Performance: Cache compiled Query objects
-        self._query_cache = {}
+        # Enclosing class names per class node, for the file being cached
+        self._enclosing_names: Dict[Node, Tuple[str, ...]] = {}
 
         # Performance: Cache file contents to avoid redundant I/O
-        # Using instance method with lru_cache via wrapper
-        @lru_cache(maxsize=500)
-        def _cached_read_file(file_path_str: str) -> Optional[str]:
-            try:
-                return Path(file_path_str).read_text(encoding='utf-8')
-            except Exception as e:
-                logger.debug(f"Error reading file {file_path_str}: {e}")
-                return None
+        self._file_cache = _FileCache(_FILE_CACHE_MAX_BYTES)
 
-        self._cached_read_file = _cached_read_file
+        # The same position is often resolved several times (e.g. repeated `list.add` calls in
+        # sibling methods), so LSP answers are memoized for as long as the server stays up
+        self._lsp_memo: "OrderedDict[Tuple[str, str, int, int], object]" = OrderedDict()
+        # file path -> (content digest, tree, source) for LSP target files, in LRU order, see _get_file_tree
+        self._target_trees: "OrderedDict[str, Tuple[bytes, Tree, bytes]]" = OrderedDict()
 
     def __enter__(self):
-        self._server_ctx = self.lsp_service.start_server()
-        self._server_ctx.__enter__()
+        # Analyzers are shared through AnalyzerFactory, so nested `with` blocks must not restart the server
+        if self._server_refcount == 0:
+            self._server_ctx = self.lsp_service.start_server()
+            self._server_ctx.__enter__()
+        self._server_refcount += 1
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        if self._server_ctx:
+        if self._server_refcount == 0:
+            return
+        self._server_refcount -= 1
+        if self._server_refcount == 0 and self._server_ctx:
             self._server_ctx.__exit__(exc_type, exc_val, exc_tb)
+            self._server_ctx = None
+            # Files may change before the next run; don't serve stale content to it
+            self._clear_file_caches()
+            self._target_trees.clear()
+
+    def _clear_file_caches(self):
+        """Drop memoized LSP answers and file reads, which hold for one version of the sources."""
+        self.clear_lsp_cache()
+        self._file_cache.clear()
+
+    def _lsp_request(self, request_name: str, file_path: str, line: int, col: int):
+        key = (request_name, file_path, line, col)
+        if key in self._lsp_memo:
+            self._lsp_memo.move_to_end(key)
+            return self._lsp_memo[key]
 
-    def _get_builtin_packages(self) -> List[str]:
+        result = getattr(self.lsp_service, request_name)(file_path, line, col)
+        self._remember_lsp_result(key, result)
+        return result
+
+    def _remember_lsp_result(self, key: Tuple[str, str, int, int], result):
+        self._lsp_memo[key] = result
+        if len(self._lsp_memo) > _LSP_CACHE_SIZE:
+            self._lsp_memo.popitem(last=False)
+
+    def _request_definition(self, file_path: str, line: int, col: int):
+        return self._lsp_request("request_definition", file_path, line, col)
+
+    def _request_implementation(self, file_path: str, line: int, col: int):
+        return self._lsp_request("request_implementation", file_path, line, col)
+
+    def _request_hover(self, file_path: str, line: int, col: int):
+        return self._lsp_request("request_hover", file_path, line, col)
+
+    def _request_definitions(self, file_path: str, positions: List[Tuple[int, int]]) -> list:
+        return self._lsp_batch_request("request_definition", file_path, positions)
+
+    def _request_hovers(self, file_path: str, positions: List[Tuple[int, int]]) -> list:
+        return self._lsp_batch_request("request_hover", file_path, positions)
+
+    def _lsp_batch_request(self, request_name: str, file_path: str, positions: List[Tuple[int, int]]) -> list:
+        """
+        Answers to request_name for several positions in file_path, aligned with positions.
+
+        Positions that are not memoized yet go to the language server as one pipelined batch.
+        A position whose request failed (e.g. ContentModified while the server is indexing)
+        answers None and is not memoized, so its next occurrence asks again.
+        """
+        results = {}
+        missing = []
+        for position in positions:
+            key = (request_name, file_path) + position
+            if key in self._lsp_memo:
+                self._lsp_memo.move_to_end(key)
+                results[position] = self._lsp_memo[key]
+            elif position not in results:
+                results[position] = None
+                missing.append(position)
+
+        if missing:
+            batch_request = getattr(self.lsp_service, f"batch_{request_name}")
+            for position, result in zip(missing, batch_request(file_path, missing)):
+                if isinstance(result, Exception):
+                    logger.debug("{} failed at {}:{}: {!r}", request_name, file_path, position, result)
+                    continue
+                results[position] = result
+                self._remember_lsp_result((request_name, file_path) + position, result)
+
+        return [results[position] for position in positions]
+
+    def clear_lsp_cache(self):
+        """Drop memoized LSP answers, e.g. after source files were edited."""
+        self._lsp_memo.clear()
+
+    def _get_builtin_packages(self) -> FrozenSet[str]:
         """Return Java builtin packages to be filtered."""
-        return list(JavaBuiltinPackages.ALL_BUILTIN_PACKAGES)
+        return JavaBuiltinPackages.ALL_BUILTIN_PACKAGES
+
+    def _get_cache_worker_args(self) -> Optional[Tuple[type, tuple, dict]]:
+        return type(self), (self._root_path, self.project_id, self.branch), {"use_lsp": False}
+
+    def _get_analysis_worker_args(self) -> Optional[Tuple[type, tuple, dict]]:
+        # Without a server of its own there is nothing a worker could resolve
+        if self.lsp_service is None:
+            return None
+        return type(self), (self._root_path, self.project_id, self.branch), {"use_lsp": True}
+
+    def _get_comment_query(self) -> Optional[str]:
+        return JavaParsingConstants.COMMENT_QUERY
+
+    def _get_type_declaration_keywords(self) -> Tuple[bytes, ...]:
+        return JavaCodeAnalyzerConstant.TYPE_DECLARATION_KEYWORDS
 
     def _strip_source_directory_prefix(self, path: str) -> str:
-        prefix = "src.main.java."
-        if path.startswith(prefix):
-            return path[len(prefix):]
+        if path.startswith(_SOURCE_DIRECTORY_PREFIX):
+            return path[len(_SOURCE_DIRECTORY_PREFIX):]
         return path
 
     def _get_code_files(self, root: Path) -> List[Path]:
-        return list(root.rglob(JavaCodeAnalyzerConstant.JAVA_EXTENSION))
+        return find_files(root, JavaCodeAnalyzerConstant.JAVA_FILE_SUFFIX, JavaCodeAnalyzerConstant.EXCLUDED_DIRS,
+                          JavaCodeAnalyzerConstant.BUILD_OUTPUT_DIRS)
 
     def _extract_package(self, root_node: Node, content: str) -> str:
         try:
@@ -92,20 +343,22 @@ class JavaCodeAnalyzer(BaseCodeAnalyzer, ABC):
         return ""
 
     def _extract_all_class_nodes(self, root_node: Node) -> List[Node]:
+        # One capture name, so declarations come back as a single list with nothing to flatten;
+        # capture order within a name is not source order, so sort to keep chunk order stable
         captures = self._query_captures("""
-            (class_declaration) @class
-            (interface_declaration) @interface
-            (enum_declaration) @enum
-            (record_declaration) @record
-            (annotation_type_declaration) @annotation
+            [
+                (class_declaration)
+                (interface_declaration)
+                (enum_declaration)
+                (record_declaration)
+                (annotation_type_declaration)
+            ] @class
         """, root_node)
-        if not captures:
-            return []
-        return [node for nodes in captures.values() for node in nodes]
+        return sorted(captures.get("class", []), key=lambda node: node.start_byte)
 
     def _extract_class_name(self, class_node: Node, content: str) -> Optional[str]:
         try:
-            identifier = self._find_child_by_type(class_node, 'identifier')
+            identifier = class_node.child_by_field_name('name')
             if identifier:
                 return extract_content(identifier, content)
         except Exception as ex:
@@ -115,43 +368,66 @@ class JavaCodeAnalyzer(BaseCodeAnalyzer, ABC):
     def _is_nested_class(self, class_node: Node, root_node: Node) -> bool:
         parent = class_node.parent
         while parent and parent != root_node:
-            if parent.type in JavaParsingConstants.CLASS_NODE_TYPES:
+            if parent.kind_id in self._class_kind_ids:
                 return True
             parent = parent.parent
         return False
 
-    def _build_full_class_name(self, class_name: str, package: str, class_node: Node,
-                               content: str, root_node: Node) -> str:
-        parent_names = []
-        parent = class_node.parent
+    def _enclosing_class_names(self, class_node: Node, content: str) -> Tuple[str, ...]:
+        """
+        Names of the classes enclosing class_node, outermost first.
 
-        while parent and parent != root_node:
-            if parent.type in JavaParsingConstants.CLASS_NODE_TYPES:
-                parent_name = self._extract_class_name(parent, content)
-                if parent_name:
-                    parent_names.append(parent_name)
+        Each class walks up only to its nearest enclosing class and extends that class's
+        memoized chain, so nesting is resolved once per class instead of once per query.
+        """
+        names = self._enclosing_names.get(class_node)
+        if names is not None:
+            return names
+
+        parent = class_node.parent
+        while parent and parent.kind_id not in self._class_kind_ids:
             parent = parent.parent
+        if parent is None:
+            names = ()
+        else:
+            names = self._enclosing_class_names(parent, content)
+            parent_name = self._extract_class_name(parent, content)
+            if parent_name:
+                names += (parent_name,)
 
-        if parent_names:
-            parent_names.reverse()
-            nested_path = '.'.join(parent_names + [class_name])
-            return f"{package}.{nested_path}" if package else nested_path
+        self._enclosing_names[class_node] = names
+        return names
 
-        return f"{package}.{class_name}" if package else class_name
+    def _build_full_class_name(self, class_name: str, package: str, class_node: Node,
+                               content: str, root_node: Node) -> str:
+        nested_path = '.'.join(self._enclosing_class_names(class_node, content) + (class_name,))
+        return f"{package}.{nested_path}" if package else nested_path
 
     def _get_parent_class(self, class_node: Node, content: str, package: str) -> Optional[str]:
-        parent = class_node.parent
-        while parent:
-            if parent.type in JavaParsingConstants.CLASS_NODE_TYPES:
-                parent_name = self._extract_class_name(parent, content)
-                if parent_name:
-                    return self._build_full_class_name(parent_name, package, parent, content, parent)
-            parent = parent.parent
-        return None
+        parent_names = self._enclosing_class_names(class_node, content)
+        if not parent_names:
+            return None
+        nested_path = '.'.join(parent_names)
+        return f"{package}.{nested_path}" if package else nested_path
+
+    def reparse_file(self, file_path: str, raw_content: bytes) -> Tuple[Tree, str]:
+        previous = self._tree_cache.get(file_path)
+        tree, content = super().reparse_file(file_path, raw_content)
+        if previous and self._tree_cache[file_path][0] != previous[0]:
+            # A new version of a file: answers anywhere may point into its old text
+            self._clear_file_caches()
+        return tree, content
+
+    def process_class_cache_file(self, file_path) -> Dict[str, ClassParsingContext]:
+        try:
+            return super().process_class_cache_file(file_path)
+        finally:
+            # Chains are keyed by node, so they only hold for the tree just processed
+            self._enclosing_names.clear()
 
     def _is_config_node(self, node: Node, content: str):
         """Check if node is a configuration node based on annotations or implements/extends"""
-        if node.type not in JavaParsingConstants.CLASS_NODE_TYPES:
+        if node.kind_id not in self._class_kind_ids:
             return False
 
         return self._has_config_annotations(node, content) or self._has_config_interfaces(node, content)
@@ -161,23 +437,22 @@ class JavaCodeAnalyzer(BaseCodeAnalyzer, ABC):
         if class_node.type == 'interface_declaration':
             return True
 
-        # Check if it's an abstract class
-        modifiers = self._find_child_by_type(class_node, 'modifiers')
-        if modifiers:
-            text_modifiers = extract_content(modifiers, content)
-            if 'abstract' in text_modifiers:
-                return True
+        # Check if it's an abstract class; modifiers, when present, come first and have no field name
+        modifiers = class_node.child(0)
+        if modifiers is not None and modifiers.type == 'modifiers':
+            # Keyword children only: comments between modifiers are nodes of the tree too
+            return any(child.type == 'abstract' for child in modifiers.children)
 
         return False
 
     def _extract_implements_with_lsp(self, class_node: Node, file_path: str, content: str) -> List[str]:
         try:
-            class_name_node = self._find_child_by_type(class_node, 'identifier')
+            class_name_node = class_node.child_by_field_name('name')
             if not class_name_node:
                 return []
 
-            line, col = self._get_node_position(class_name_node)
-            lsp_results = self.lsp_service.request_implementation(file_path, line, col)
+            line, col = class_name_node.start_point
+            lsp_results = self._request_implementation(file_path, line, col)
             return self._resolve_lsp_implements(lsp_results)
         except Exception as e:
             logger.debug(f"LSP resolution failed for {file_path}:{line}:{col} - {e}")
@@ -191,39 +466,64 @@ class JavaCodeAnalyzer(BaseCodeAnalyzer, ABC):
             return methods
 
         try:
-            for child in class_body.children:
-                if child.type == 'method_declaration' or child.type == 'constructor_declaration':
-                    method = self._process_method_node(
-                        child, content, implements,
-                        full_class_name, class_node, file_path, import_mapping, class_name
-                    )
-                    if method:
-                        methods.append(method)
+            method_nodes = [child for child in class_body.children
+                            if child.type == 'method_declaration' or child.type == 'constructor_declaration']
+            dependencies = [self._query_method_dependencies(method_node) for method_node in method_nodes]
+            self._prefetch_method_dependencies(dependencies, file_path, content, import_mapping)
+
+            for method_node, method_dependencies in zip(method_nodes, dependencies):
+                method = self._process_method_node(
+                    method_node, content, implements,
+                    full_class_name, class_node, file_path, import_mapping, class_name, method_dependencies
+                )
+                if method:
+                    methods.append(method)
         except Exception as e:
             logger.debug(f"Error extracting methods from {file_path}: {e}")
         return methods
 
-    def build_import_mapping(self, class_node: Node, content: str) -> Dict[str, str]:
-        import_mapping = {}
+    def _prefetch_method_dependencies(self, dependencies: List[Tuple[List[Dict[str, Node]], dict, dict]],
+                                      file_path: str, content: str, import_mapping: Dict[str, str]):
+        """
+        Ask the LSP about every call, type and field position of a class's methods in one
+        definition batch and one hover batch, so per-method extraction is served from the memo.
+        """
+        definition_positions, hover_positions = [], []
+        for call_matches, type_captures, field_captures in dependencies:
+            definition_positions.extend(
+                name_node.start_point for name_node, _ in self._method_call_candidates(call_matches, content))
+            type_nodes = [node for capture_name, nodes in type_captures.items()
+                          if capture_name in _USED_TYPE_CAPTURES for node in nodes]
+            _, pending = self._split_used_types(type_nodes, content, import_mapping)
+            definition_positions.extend(node.start_point for node, _ in pending)
+            hover_positions.extend(node.end_point for node in field_captures.get("field_name", ()))
 
         try:
-            captures = self._query_captures("""
-               (import_declaration
-                  [
-                    (scoped_identifier) @import_path
-                    (identifier) @import_path
-                  ]
-                ) @test
-            """, class_node)
+            if definition_positions:
+                self._request_definitions(file_path, definition_positions)
+            if hover_positions:
+                self._request_hovers(file_path, hover_positions)
+        except Exception as e:
+            logger.debug(f"LSP prefetch failed for {file_path}: {e}")
+
+    def build_import_mapping(self, root_node: Node, content: str) -> Dict[str, str]:
+        import_mapping = {}
 
-            import_nodes = captures.get("import_path", [])
-            for import_node in import_nodes:
-                import_path = extract_content(import_node, content)
-                if import_path and '.' in import_path:
-                    class_name = import_path.split('.')[-1]
-                    if class_name == "*":
+        try:
+            # Imports are direct children of the compilation unit, so read them off the
+            # root instead of running a query over the whole file
+            for declaration in root_node.children:
+                if declaration.type != 'import_declaration':
+                    continue
+                for import_node in declaration.named_children:
+                    if import_node.type not in ('scoped_identifier', 'identifier'):
                         continue
-                    import_mapping[class_name] = import_path
+                    import_path = extract_content(import_node, content)
+                    if import_path and '.' in import_path:
+                        class_name = import_path.split('.')[-1]
+                        if class_name == "*":
+                            continue
+                        import_mapping[class_name] = import_path
 
         except Exception as e:
             logger.debug(f"Error building import mapping: {e}")
@@ -241,20 +541,15 @@ class JavaCodeAnalyzer(BaseCodeAnalyzer, ABC):
                     )
             """, class_node)
 
-            for capture_name, nodes in captures.items():
-                if capture_name in {"field_type", "generic_type"}:
-                    for node in nodes:
-                        type_text = extract_content(node, content)
-                        resolved_type = self._resolve_used_type_with_lsp(node, file_path, type_text, import_mapping)
-                        if resolved_type:
-                            used_types.add(resolved_type)
+            nodes = captures.get("field_type", []) + captures.get("generic_type", [])
+            used_types.update(self._resolve_used_types(nodes, file_path, content, import_mapping))
 
         except Exception as e:
             logger.debug(f"Error extracting class use types from {file_path}: {e}")
 
         return tuple(self.filter_builtin_items(list(used_types)))
 
-    def _has_any_annotation_from_set(self, node: Node, content: str, annotation_set: set) -> bool:
+    def _has_any_annotation_matching(self, node: Node, content: str, annotation_pattern: re.Pattern) -> bool:
         try:
             captures = self._query_captures("""
                 (modifiers (annotation) @annotation)
@@ -264,7 +559,7 @@ class JavaCodeAnalyzer(BaseCodeAnalyzer, ABC):
             for nodes in captures.values():
                 for annotation_node in nodes:
                     annotation_text = extract_content(annotation_node, content)
-                    if any(anno in annotation_text for anno in annotation_set):
+                    if annotation_pattern.search(annotation_text):
                         return True
             return False
         except Exception as e:
@@ -273,21 +568,19 @@ class JavaCodeAnalyzer(BaseCodeAnalyzer, ABC):
 
     def _has_config_annotations(self, node: Node, content: str) -> bool:
         """Check if node has configuration annotations."""
-        return self._has_any_annotation_from_set(node, content, JavaParsingConstants.CONFIG_NODE_ANNOTATIONS)
+        return self._has_any_annotation_matching(node, content, JavaParsingConstants.CONFIG_NODE_ANNOTATIONS_RE)
 
     def _has_config_interfaces(self, node: Node, content: str) -> bool:
         """Check if node implements/extends configuration interfaces"""
         implemented_classes = self._extract_implements_extends(node, content)
         return any(class_name in JavaParsingConstants.CONFIG_INTERFACES_CLASSES for class_name in implemented_classes)
 
-    def _is_lombok_generated_position(self, target_line: int, content: str) -> bool:
+    def _is_lombok_generated_position(self, target_line: int, file_path: str) -> bool:
         """Check if the target line contains Lombok annotations that generate methods."""
         try:
-            lines = content.split('\n')
+            lines = self._read_file_lines(file_path)
             if target_line < len(lines):
-                line_content = lines[target_line].strip()
-                return any(lombok_ann in line_content
-                           for lombok_ann in JavaParsingConstants.LOMBOK_METHOD_ANNOTATIONS)
+                return bool(JavaParsingConstants.LOMBOK_METHOD_ANNOTATIONS_RE.search(lines[target_line]))
         except Exception:
             pass
         return False
@@ -296,16 +589,15 @@ class JavaCodeAnalyzer(BaseCodeAnalyzer, ABC):
         """Extract class names from implements and extends clauses using tree-sitter query"""
         try:
             captures = self._query_captures("""
-                (superclass (type_identifier) @extends_class)
-                (super_interfaces (type_list (_ (type_identifier) @implements_class)))
+                (superclass (type_identifier) @super_class)
+                (super_interfaces (type_list (_ (type_identifier) @super_class)))
             """, class_node)
 
             classes = []
-            for capture_name, nodes in captures.items():
-                for node in nodes:
-                    class_name = extract_content(node, content)
-                    if class_name:
-                        classes.append(class_name)
+            for node in captures.get("super_class", []):
+                class_name = extract_content(node, content)
+                if class_name:
+                    classes.append(class_name)
 
             return classes
         except Exception as e:
@@ -313,33 +605,23 @@ class JavaCodeAnalyzer(BaseCodeAnalyzer, ABC):
             return []
 
     def _get_class_body(self, class_node: Node) -> Optional[Node]:
-        for child in class_node.children:
-            if child.type == 'class_body' or child.type == 'interface_body':
-                return child
-        return None
+        body = class_node.child_by_field_name('body')
+        return body if body is not None and body.type in ('class_body', 'interface_body') else None
 
     def _extract_method_name(self, class_node: Node, content: str) -> Tuple[Optional[str], Optional[Node]]:
         if class_node.type != 'method_declaration':
             return None, None
 
-        method_name = None
-        method_params = None
-        method_name_node = None
-
-        for child in class_node.children:
-            if child.type == 'identifier':
-                method_name = normalize_whitespace(extract_content(child, content))
-                method_name_node = child
-            elif child.type == 'formal_parameters':
-                method_params = extract_content(child, content)
-            if method_name is not None and method_params is not None:
-                break
-
-        if method_name is None:
+        method_name_node = class_node.child_by_field_name('name')
+        if method_name_node is None:
             return None, None
 
-        method_signature = f"{method_name}{method_params or '()'}"
-        method_signature = normalize_whitespace(method_signature)
+        # The name is a single identifier, so only the parameter list can carry whitespace;
+        # one normalization pass over the joined signature covers both
+        params_node = class_node.child_by_field_name('parameters')
+        method_params = self._extract_code(params_node, content) if params_node is not None else None
+
+        method_signature = normalize_whitespace(extract_content(method_name_node, content) + (method_params or '()'))
         return method_signature, method_name_node
 
     def _extract_all_method_names_from_class(self, class_node: Node, content: str, full_class_name: str) -> List[str]:
@@ -364,23 +646,25 @@ class JavaCodeAnalyzer(BaseCodeAnalyzer, ABC):
     def _process_method_node(self, method_node: Node, content: str,
                              implements: List[str], full_class_name: str,
                              class_node: Node, file_path: str, import_mapping: Dict[str, str],
-                             class_name: str) -> Optional[Method]:
+                             class_name: str,
+                             dependencies: Optional[Tuple[List[Dict[str, Node]], dict, dict]] = None
+                             ) -> Optional[Method]:
         try:
             method_name, method_name_node = self._extract_method_name(method_node, content)
             if not method_name:
                 return None
 
             body = ""
+            call_matches, type_captures, field_captures = (
+                dependencies or self._query_method_dependencies(method_node))
             method_calls = self.filter_builtin_items(
-                self._extract_method_calls(method_node, file_path, content))
+                self._extract_method_calls(call_matches, file_path, content))
             used_types = self.filter_builtin_items(
-                self._extract_used_types(method_node, file_path, content, import_mapping))
-            field_access = self.filter_builtin_items(self._extract_field_access(method_node, file_path))
+                self._extract_used_types(type_captures, file_path, content, import_mapping))
+            field_access = self.filter_builtin_items(self._extract_field_access(field_captures, file_path))
 
-            for child in method_node.children:
-                if child.type == 'block' or child.type == 'constructor_body':
-                    body = extract_content(method_node, content)
-                    break
+            if method_node.child_by_field_name('body') is not None:
+                body = self._extract_code(method_node, content)
 
             endpoint = self.endpoint_extractor.extract_from_method(method_node, content, class_node)
 
@@ -398,7 +682,7 @@ class JavaCodeAnalyzer(BaseCodeAnalyzer, ABC):
                 method_type = ChunkType.CONFIGURATION
 
             # Compute AST hash for method body
-            method_ast_hash = self.compute_ast_hash(body) if body else ""
+            method_ast_hash = self.compute_ast_hash(method_node) if body else ""
 
             return Method(
                 name=method_name,
@@ -422,95 +706,104 @@ class JavaCodeAnalyzer(BaseCodeAnalyzer, ABC):
             return None
 
     def _is_abstract_or_interface_method(self, method_node: Node) -> bool:
-        for child in method_node.children:
-            if child.type == 'block' or child.type == 'constructor_body':
-                return False
-        return True
+        return method_node.child_by_field_name('body') is None
 
     def _build_inheritance_info(self, method_name_node: Node, file_path: str) -> List[str]:
-        line, col = self._get_node_position(method_name_node)
-        lsp_results = self.lsp_service.request_implementation(file_path, line, col)
+        line, col = method_name_node.start_point
+        lsp_results = self._request_implementation(file_path, line, col)
         return self._resolve_lsp_method_implements(lsp_results)
 
-    def _extract_method_calls(
-            self,
-            method_node: Node,
-            file_path: str,
-            content: str
-    ) -> List[MethodCall]:
+    def _query_method_dependencies(self, method_node: Node) -> Tuple[List[Dict[str, Node]], dict, dict]:
+        """
+        Run the fused method-call/used-type/field-access query over method_node once.
+
+        Returns:
+            Tuple of (method call matches, used type captures, field access captures). Each call
+            match maps the unprefixed capture names of one call site to their nodes, so a call's
+            object, name and arguments always belong together; the optional object is simply
+            absent. Captures map unprefixed names to all their nodes.
+        """
+        call_matches, type_captures, field_captures = [], {}, {}
+        for _, match in self._query_matches(_METHOD_DEPENDENCY_QUERY, method_node):
+            if not match:
+                continue
+            prefix = next(iter(match))[:3]
+            if prefix == _METHOD_CALL_PREFIX:
+                call_matches.append({name[3:]: nodes[0] for name, nodes in match.items()})
+            else:
+                captures = type_captures if prefix == _USED_TYPE_PREFIX else field_captures
+                for name, nodes in match.items():
+                    captures.setdefault(name[3:], []).extend(nodes)
+        return call_matches, type_captures, field_captures
+
+    def _extract_method_calls(self, call_matches: List[Dict[str, Node]], file_path: str,
+                              content: str) -> List[MethodCall]:
         method_calls: List[MethodCall] = []
         try:
-            captures = self._query_method_invocations(method_node)
-            return self._convert_captures_to_method_calls(captures, file_path, content)
+            return self._convert_matches_to_method_calls(call_matches, file_path, content)
 
         except Exception as e:
             logger.debug(f"Error extracting method calls from {file_path}: {e}")
 
         return method_calls
 
-    def _query_method_invocations(self, method_node):
-        return self._query_captures("""
-            [
-              (method_invocation
-                object: (_) @object
-                name: (identifier) @method_name
-                arguments: (argument_list)? @arguments
-              ) @call
-    
-              (method_invocation
-                name: (identifier) @method_name
-                arguments: (argument_list)? @arguments
-              ) @call
-            ]
-        """, method_node)
-
-    def _convert_captures_to_method_calls(self, captures: dict, file_path: str, content: str) -> List[MethodCall]:
-        method_calls = []
-        call_nodes = captures.get("call", [])
-        object_nodes = captures.get("object", [])
-        method_nodes = captures.get("method_name", [])
-        args_nodes = captures.get("arguments", [])
+    def _convert_matches_to_method_calls(self, call_matches: List[Dict[str, Node]], file_path: str,
+                                         content: str) -> List[MethodCall]:
+        # Filter locally first, then resolve every remaining call in one LSP batch
+        candidates = self._method_call_candidates(call_matches, content)
+        if not candidates:
+            return []
 
-        for i, call_node in enumerate(call_nodes):
-            method_call = self._process_single_method_call(i, object_nodes, method_nodes, args_nodes, file_path,
-                                                           content)
-            if method_call:
-                method_calls.append(method_call)
+        positions = [name_node.start_point for name_node, _ in candidates]
+        try:
+            lsp_results = self._request_definitions(file_path, positions)
+        except Exception as e:
+            logger.debug(f"LSP method call resolution failed: {e}")
+            return []
 
-        return method_calls
+        method_calls = []
+        for (name_node, object_name), lsp_result in zip(candidates, lsp_results):
+            resolved = self._method_call_from_lsp(lsp_result)
+            if resolved:
+                if object_name and hasattr(resolved, "object_name"):
+                    resolved.object_name = object_name
+                method_calls.append(resolved)
 
-    def _process_single_method_call(self, index: int, object_nodes: list, method_nodes: list, args_nodes: list,
-                                    file_path: str, content: str) -> Optional[MethodCall]:
-        object_node = object_nodes[index] if index < len(object_nodes) else None
-        object_name = extract_content(object_node, content) if object_node else None
+        return method_calls
 
-        if object_name and self._check_primitive_types(object_name):
+    def _method_call_candidates(self, call_matches: List[Dict[str, Node]],
+                                content: str) -> List[Tuple[Node, Optional[str]]]:
+        candidates = []
+        for match in call_matches:
+            candidate = self._method_call_candidate(match, content)
+            if candidate:
+                candidates.append(candidate)
+        return candidates
+
+    def _method_call_candidate(self, match: Dict[str, Node], content: str) -> Optional[Tuple[Node, Optional[str]]]:
+        """Return (method name node, object name) for a call worth resolving, or None."""
+        # Most calls go to library methods the project doesn't declare, so test the name first;
+        # it is a single identifier node, so its text needs no whitespace normalization
+        name_node = match.get("method_name")
+        if name_node is None:
             return None
-        name_node = method_nodes[index] if index < len(method_nodes) else None
-        method_name = normalize_whitespace(extract_content(name_node, content))
+        method_name = extract_content(name_node, content)
         if method_name and method_name not in self.methods_cache:
-            # logger.info(f"Method {method_name} not in methods cache")
             return None
-        try:
-            args_node = args_nodes[index] if index < len(args_nodes) else None
-
-            resolved = self._resolve_method_call(name_node, file_path)
-            if resolved and object_name and hasattr(resolved, "object_name"):
-                resolved.object_name = object_name
 
-            return resolved
-        except Exception:
+        object_node = match.get("object")
+        object_name = extract_content(object_node, content) if object_node else None
+        if object_name and self._check_primitive_types(object_name):
             return None
+        return name_node, object_name
 
-    def _resolve_method_call(self, node, file_path: str):
+    def _method_call_from_lsp(self, lsp_result) -> Optional[MethodCall]:
         try:
-            line, col = self._get_node_position(node)
-            lsp_result = self.lsp_service.request_definition(file_path, line, col)
-            if not lsp_result or len(lsp_result) == 0:
+            if not lsp_result:
                 return None
 
             full_method_def = self._build_full_method_name_from_lsp(lsp_result[0])
-            return MethodCall(name=full_method_def, params=[]) if full_method_def else None
+            return MethodCall(name=sys.intern(full_method_def)) if full_method_def else None
 
         except Exception as e:
             logger.debug(f"LSP method call resolution failed: {e}")
@@ -536,49 +829,57 @@ class JavaCodeAnalyzer(BaseCodeAnalyzer, ABC):
 
         return f"{absolute_path}.{qualified_name}"
 
-    def _extract_used_types(self, body_node: Node, file_path: str, content: str, import_mapping: Dict[str, str]) -> \
+    def _extract_used_types(self, captures: dict, file_path: str, content: str, import_mapping: Dict[str, str]) -> \
             List[str]:
         used_types = set()
         try:
-            variable_query = Query(self.language, """
-                (local_variable_declaration type: (_) @var_type)
-                (method_declaration type: (_) @return_type)
-                (formal_parameter type: (_) @param_type)
-                (spread_parameter (type_identifier) @varargs_type)
-                (type_arguments (_) @generic_type)
-                (array_type element: (_) @array_element_type)
-                (scoped_type_identifier) @first_scoped
-                (#not-ancestor? @first_scoped scoped_type_identifier)
-            """)
-            query_cursor = QueryCursor(variable_query)
-            captures = query_cursor.captures(body_node)
-            for capture_name, nodes in captures.items():
-                if capture_name in {
-                    "var_type", "return_type", "param_type", "varargs_type",
-                    "generic_type", "array_element_type", "first_scoped"
-                }:
-                    for node in nodes:
-                        text = extract_content(node, content)
-                        variable_ref = self._resolve_used_type_with_lsp(node, file_path, text, import_mapping)
-                        if variable_ref:
-                            used_types.add(variable_ref)
+            nodes = [node for capture_name, capture_nodes in captures.items() if capture_name in _USED_TYPE_CAPTURES
+                     for node in capture_nodes]
+            used_types.update(self._resolve_used_types(nodes, file_path, content, import_mapping))
         except Exception as e:
             logger.debug(f"Error extracting used types from {file_path}: {e}")
         return list(used_types)
 
-    def _extract_field_access(self, body_node: Node, file_path: str) -> List[str]:
+    def _split_used_types(self, nodes: List[Node], content: str,
+                          import_mapping: Dict[str, str]) -> Tuple[List[str], List[Tuple[Node, str]]]:
+        """
+        Split type nodes into types resolved from imports and (node, type name) pairs left
+        for the LSP. Primitive and excluded types are dropped.
+        """
+        imported, pending = [], []
+        for node in nodes:
+            text = extract_content(node, content)
+            if self._check_primitive_types(text):
+                continue
+            if text in import_mapping:
+                imported.append(import_mapping[text])
+            else:
+                pending.append((node, text))
+        return imported, pending
+
+    def _resolve_used_types(self, nodes: List[Node], file_path: str, content: str,
+                            import_mapping: Dict[str, str]) -> List[str]:
+        # Imported and primitive types resolve locally, the rest go to the LSP in one batch
+        resolved, pending = self._split_used_types(nodes, content, import_mapping)
+        if pending:
+            positions = [node.start_point for node, _ in pending]
+            for (_, text), lsp_results in zip(pending, self._request_definitions(file_path, positions)):
+                variable_ref = self._resolve_lsp_type_response(lsp_results, text)
+                if variable_ref:
+                    resolved.append(variable_ref)
+        return resolved
+
+    def _extract_field_access(self, captures: dict, file_path: str) -> List[str]:
         field_access = set()
         try:
-            captures = self._query_captures("""
-                (field_access field: (_) @field_name)
-            """, body_node)
-
-            for capture_name, nodes in captures.items():
-                if capture_name == "field_name":
-                    for node in nodes:
-                        resolved = self._resolve_field_access_with_lsp(node, file_path)
-                        if resolved:
-                            field_access.add(resolved)
+            field_nodes = captures.get("field_name")
+            if field_nodes:
+                # Hover right after the field name, all fields of the method in one batch
+                positions = [node.end_point for node in field_nodes]
+                for hover in self._request_hovers(file_path, positions):
+                    resolved = self._extract_field_from_hover(hover)
+                    if resolved:
+                        field_access.add(resolved)
         except Exception as e:
             logger.debug(f"Error extracting field access from {file_path}: {e}")
         return list(field_access)
@@ -646,41 +947,42 @@ class JavaCodeAnalyzer(BaseCodeAnalyzer, ABC):
 
     def _extract_file_info_from_lsp(self, lsp_result: dict) -> Optional[Tuple[str, int, int]]:
         """Extract file path and position from LSP result."""
-        file_path = lsp_result.get('absolutePath') or lsp_result.get('uri', '').replace('file:///', '')
+        # multilspy fills absolutePath for every location; the uri is only a fallback
+        file_path = lsp_result.get('absolutePath')
         if not file_path:
-            return None
-        file_path_check = self._get_absolute_path(file_path)
-        if not file_path_check:
+            uri = lsp_result.get('uri')
+            if not uri:
+                return None
+            file_path = PathUtils.uri_to_path(uri)
+        if not self._get_absolute_path(file_path):
             return None
 
         range_info = lsp_result.get('range')
         if not range_info:
             return None
 
-        start_line = range_info['start']['line']
-        start_char = range_info['start']['character']
-
-        return (file_path, start_line, start_char)
+        start = range_info['start']
+        return (file_path, start['line'], start['character'])
 
     def _find_method_from_file(self, file_path: str, line: int, character: int) -> Optional[Node]:
         """Parse file and find method node at specified position."""
         try:
-            content = self._read_file_content(file_path)
-            if not content:
+            tree = self._get_file_tree(file_path)
+            if tree is None:
                 return None
-
-            tree = self.parser.parse(content.encode('utf-8'))
             root_node = tree.root_node
 
             # Find the method node at the specified position
             method_node = self._find_method_at_position(root_node, line, character)
 
             if not method_node:
-                # Check if this might be a Lombok-generated method
-                if self._is_lombok_generated_position(line, content):
-                    logger.debug(f"Skipping Lombok-generated method at line {line} in {file_path}")
-                else:
-                    logger.debug(f"No method found at line {line}, character {character} file {file_path}")
+                # The Lombok check only picks the message, so it runs only when debug logs are emitted
+                logger.opt(lazy=True).debug(
+                    "{}",
+                    lambda: f"Skipping Lombok-generated method at line {line} in {file_path}"
+                    if self._is_lombok_generated_position(line, file_path)
+                    else f"No method found at line {line}, character {character} file {file_path}"
+                )
                 return None
 
             return method_node
@@ -696,15 +998,18 @@ class JavaCodeAnalyzer(BaseCodeAnalyzer, ABC):
         return self._extract_method_with_params_from_lsp_result(result)
 
     def _adjust_qualified_name_for_type(self, qualified_name: str, type_name: str) -> str:
-        if not (type_name and type_name != "var" and "." in qualified_name):
+        if not type_name or type_name == "var":
+            return qualified_name
+        dot = qualified_name.rfind(".")
+        if dot < 0:
             return qualified_name
 
-        class_type = qualified_name.split('.')[-1]
+        class_type = qualified_name[dot + 1:]
         if class_type == type_name:
             return qualified_name
 
         if "." in type_name:
-            return qualified_name.rsplit(".", 1)[0] + "." + type_name
+            return qualified_name[:dot] + "." + type_name
         else:
             return qualified_name.rstrip(".") + "." + type_name
 
@@ -715,44 +1020,29 @@ class JavaCodeAnalyzer(BaseCodeAnalyzer, ABC):
                 return None
             if type_name in import_mapping:
                 return import_mapping[type_name]
-            line, col = self._get_node_position(node)
-            lsp_results = self.lsp_service.request_definition(file_path, line, col)
+            line, col = node.start_point
+            lsp_results = self._request_definition(file_path, line, col)
             return self._resolve_lsp_type_response(lsp_results, type_name)
 
         except Exception as e:
             logger.debug(f"LSP variable resolution failed: {e}")
             return None
 
-    def _resolve_field_access_with_lsp(self, node: Node, file_path: str) -> Optional[str]:
-        try:
-            line = node.end_point[0]
-            col = node.end_point[1]
-
-            lsp_results = self.lsp_service.request_hover(file_path, line, col)
-            return self._extract_field_from_hover(lsp_results)
-
-        except Exception as e:
-            logger.debug(f"LSP field access resolution failed: {e}")
-            return None
-
     def _extract_field_from_hover(self, lsp_result) -> Optional[str]:
-        if not lsp_result or "contents" not in lsp_result:
-            return None
-
-        contents = lsp_result["contents"]
-        if isinstance(contents, dict):
-            field = contents.get("value")
-        elif isinstance(contents, list) and contents:
-            if isinstance(contents[0], dict):
-                field = contents[0].get("value")
-            else:
-                field = str(contents[0])
-        elif isinstance(contents, str):
-            field = contents
-        else:
+        if not lsp_result:
             return None
 
-        return field
+        # Hover contents come straight from JSON, so exact type checks are enough
+        contents = lsp_result.get("contents")
+        contents_type = type(contents)
+        if contents_type is dict:
+            return contents.get("value")
+        if contents_type is str:
+            return contents
+        if contents_type is list and contents:
+            first = contents[0]
+            return first.get("value") if type(first) is dict else str(first)
+        return None
 
     def _is_annotation_declaration(self, node: Node) -> bool:
         return node.type == 'annotation_type_declaration'
@@ -787,8 +1077,7 @@ class JavaCodeAnalyzer(BaseCodeAnalyzer, ABC):
             for ann_node in annotation_nodes:
                 # Extract name: @Validation(value="...") -> Validation
                 # marker_annotation: @Validation -> Validation
-                name_node = self._find_child_by_type(ann_node, 'identifier') or \
-                            self._find_child_by_type(ann_node, 'scoped_identifier')
+                name_node = ann_node.child_by_field_name('name')
 
                 if not name_node:
                     continue
@@ -837,8 +1126,8 @@ class JavaCodeAnalyzer(BaseCodeAnalyzer, ABC):
 
         # Try LSP definition (most accurate)
         try:
-            line, col = self._get_node_position(name_node)
-            lsp_results = self.lsp_service.request_definition(file_path, line, col)
+            line, col = name_node.start_point
+            lsp_results = self._request_definition(file_path, line, col)
 
             if lsp_results:
                 # Normalize to list
@@ -966,115 +1255,111 @@ class JavaCodeAnalyzer(BaseCodeAnalyzer, ABC):
 
     def _resolve_class_path_with_hover(self, result: dict, file_path: str) -> Optional[str]:
         try:
-            line = result.get('range', {}).get('start', {}).get('line')
-            col = result.get('range', {}).get('start', {}).get('character')
+            # A location without a start position can't be hovered, so don't ask the server
+            range_info = result.get('range')
+            start = range_info.get('start') if range_info else None
+            if not start:
+                return None
 
-            lsp_hover = self.lsp_service.request_hover(file_path, line, col)
+            lsp_hover = self._request_hover(file_path, start.get('line'), start.get('character'))
             if not lsp_hover:
                 return None
 
-            method_value = lsp_hover.get('contents', {}).get('value')
-            return self._resolve_class_from_hover(method_value)
+            contents = lsp_hover.get('contents')
+            method_value = contents.get('value') if type(contents) is dict else None
+            return self._resolve_class_from_hover(method_value) if method_value else None
         except Exception:
             return None
 
     def _resolve_class_from_hover(self, signature: str) -> Optional[str]:
-        pattern_with_class = re.compile(
-            r"""^(?P<return>(?:@\w+(?:\([^)]*\))?\s+)*
-        (?:[\w$.]+)
-        (?:<[^>]+>+)?
-        (?:\[\])*
-    )\s+
-    (?P<class>[\w$.]+)\.(?P<method>\w+)\(""",
-            re.VERBOSE,
-        )
-
-        s = signature.strip()
-        m = pattern_with_class.match(s)
-        if not m:
-            return None
-
-        return m.groupdict().get('class')
+        return _class_from_hover_signature(signature)
 
     def _find_method_at_position(self, root_node: Node, target_line: int, target_char: int) -> Optional[Node]:
         """Find the method declaration node that contains the target position"""
         try:
-            captures = self._query_captures("(method_declaration) @method", root_node)
-
-            for method_node in captures.get('method', []):
-                if self._is_position_in_method_identifier(method_node, target_line, target_char):
-                    return method_node
+            # Descend straight to the position instead of matching every method in the file
+            point = (target_line, target_char)
+            method_node = root_node.descendant_for_point_range(point, point)
+            while method_node is not None and method_node.type != 'method_declaration':
+                method_node = method_node.parent
+
+            if method_node is not None and self._is_position_in_method_identifier(method_node, target_line, target_char):
+                return method_node
             return None
         except Exception as e:
             logger.debug(f"Error finding method at position: {e}")
             return None
 
     def _is_position_in_method_identifier(self, method_node: Node, target_line: int, target_char: int) -> bool:
-        for child in method_node.children:
-            if child.type == 'identifier':
-                return (child.start_point[0] == target_line and
-                        child.start_point[1] <= target_char <= child.end_point[1])
-        return False
+        name_node = method_node.child_by_field_name('name')
+        if name_node is None:
+            return False
+        start_line, start_char = name_node.start_point
+        return start_line == target_line and start_char <= target_char <= name_node.end_point[1]
 
     def _has_multiple_classes(self, file_path: str) -> bool:
         try:
-            content = self._read_file_content(file_path)
-            if not content:
+            tree = self._get_file_tree(file_path)
+            if tree is None:
                 return False
-            tree = self.parser.parse(content.encode('utf-8'))
-            class_nodes = self._extract_all_class_nodes(tree.root_node)
-            return len(class_nodes) > 1
+            root_node = tree.root_node
+            top_level = [child for child in root_node.named_children
+                         if child.kind_id in self._class_kind_ids]
+            if len(top_level) != 1:
+                return len(top_level) > 1 or len(self._extract_all_class_nodes(root_node)) > 1
+            # A single top-level type: any declaration inside its body is the second one
+            body = top_level[0].child_by_field_name('body')
+            return body is not None and bool(self._extract_all_class_nodes(body))
         except Exception as e:
             logger.debug(f"Error checking multiple classes in {file_path}: {e}")
             return False
 
-    def _get_node_position(self, node: Node) -> Tuple[int, int]:
-        """Extract line and column from node's start position."""
-        return node.start_point[0], node.start_point[1]
-
-    def _get_or_create_query(self, query_string: str) -> Query:
-        if query_string not in self._query_cache:
-            self._query_cache[query_string] = Query(self.language, query_string)
-        return self._query_cache[query_string]
-
-    def _query_captures(self, query_string: str, node: Node) -> dict:
-        """Execute tree-sitter query and return captures."""
-        try:
-            query = self._get_or_create_query(query_string)
-            return QueryCursor(query).captures(node)
-        except Exception as e:
-            logger.debug(f"Query execution failed for query '{query_string[:50]}...': {e}")
-            return {}
-
-    def _find_child_by_type(self, node: Node, child_type: str) -> Optional[Node]:
-        """Find first child node with specified type."""
-        for child in node.children:
-            if child.type == child_type:
-                return child
-        return None
-
-    def _find_children_by_types(self, node: Node, child_types: set) -> List[Node]:
-        """Find all children with types in the specified set."""
-        return [child for child in node.children if child.type in child_types]
-
-    def _validate_dict_result(self, result) -> bool:
-        """Check if result is a valid dictionary."""
-        return isinstance(result, dict)
-
     def _extract_and_validate_absolute_path(self, result: dict) -> Optional[str]:
-        if not self._validate_dict_result(result):
+        if not isinstance(result, dict):
             return None
         absolute_path = result.get('absolutePath')
         return absolute_path if (absolute_path and isinstance(absolute_path, str)) else None
 
     def _read_file_content(self, file_path: str) -> Optional[str]:
         """Read file content with UTF-8 encoding and error handling."""
-        return self._cached_read_file(file_path)
+        return self._file_cache.read_text(file_path)
+
+    def _read_file_bytes(self, file_path: str) -> Optional[bytes]:
+        """Read raw file content, cached per path."""
+        return self._file_cache.read_bytes(file_path)
+
+    def _get_file_tree(self, file_path: str) -> Optional[Tree]:
+        """
+        Parsed tree of file_path, which LSP answers point into many times per run.
+
+        A tree already cached for the analyzed file is reused when its content matches;
+        other files are parsed once and kept in a bounded LRU, and reparsed incrementally
+        when their content changes.
+        """
+        source = self._read_file_bytes(file_path)
+        if not source:
+            return None
+
+        digest = self._content_digest(source)
+        cached = self._tree_cache.get(file_path)
+        if cached and cached[0] == digest:
+            return cached[1]
+
+        cached = self._target_trees.pop(file_path, None)
+        if cached and cached[0] == digest:
+            self._target_trees[file_path] = cached
+            return cached[1]
+
+        tree = self._parse_source(source, cached[1:] if cached else None)
+        self._target_trees[file_path] = (digest, tree, source)
+        if len(self._target_trees) > _TARGET_TREE_CACHE_SIZE:
+            self._target_trees.popitem(last=False)
+        return tree
+
+    def _read_file_lines(self, file_path: str) -> Tuple[str, ...]:
+        """Lines of file_path, split once per file rather than once per lookup."""
+        return self._file_cache.read_lines(file_path)
 
     def _check_primitive_types(self, object_name: str) -> bool:
-        if object_name in JavaBuiltinPackages.JAVA_PRIMITIVES:
-            return True
-        for i in JavaBuiltinPackages.JAVA_EXCLUDE_TYPE_FORMAT:
-            if object_name.startswith(i):
-                return True
-        return False
+        return (object_name in JavaBuiltinPackages.JAVA_PRIMITIVES
+                or object_name.startswith(JavaBuiltinPackages.JAVA_EXCLUDE_TYPE_PREFIXES))
@@ -8,12 +8,14 @@ import argparse
 import logging
 import sys
 import time
+from logging.handlers import MemoryHandler
 from pathlib import Path
 from typing import Optional
 
 from source_atlas.analyzers.analyzer_factory import AnalyzerFactory
 from source_atlas.config.config import configs
 from source_atlas.neo4jdb.neo4j_service import Neo4jService
+from source_atlas.runner import timed
 
 
 def setup_logging(verbose: bool = False) -> logging.Logger:
@@ -28,12 +30,17 @@ def setup_logging(verbose: bool = False) -> logging.Logger:
     """
     level = logging.DEBUG if verbose else logging.INFO
     
+    log_format = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    file_handler = logging.FileHandler('source_atlas.log')
+    file_handler.setFormatter(logging.Formatter(log_format))
+
     logging.basicConfig(
         level=level,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        format=log_format,
         handlers=[
             logging.StreamHandler(sys.stdout),
-            logging.FileHandler('source_atlas.log'),
+            # Buffer file writes; flushed every 1024 records, on ERROR and at shutdown
+            MemoryHandler(capacity=1024, flushLevel=logging.ERROR, target=file_handler),
         ]
     )
     
@@ -90,7 +97,8 @@ def analyze_command(args: argparse.Namespace) -> int:
         
         # Parse project
         with analyzer:
-            chunks = analyzer.parse_project(project_path)
+            chunks = analyzer.parse_project(project_path, parallel=args.parallel,
+                                            analysis_workers=args.analysis_workers)
         
         logger.info(f"Found {len(chunks)} code chunks")
         
@@ -104,18 +112,14 @@ def analyze_command(args: argparse.Namespace) -> int:
         if not args.skip_neo4j:
             logger.info("Importing chunks to Neo4j...")
             neo4j_service = Neo4jService()
-            import_start = time.perf_counter()
-            
-            neo4j_service.import_code_chunks(
-                chunks=chunks,
-                batch_size=args.batch_size,
-                main_branch=args.branch,
-                base_branch=args.base_branch,
-                pull_request_id=args.pull_request_id
-            )
-            
-            import_elapsed = time.perf_counter() - import_start
-            logger.info(f"Imported {len(chunks)} chunks to Neo4j in {import_elapsed:.2f}s")
+            with timed(f"Imported {len(chunks)} chunks to Neo4j", logger):
+                neo4j_service.import_code_chunks(
+                    chunks=chunks,
+                    batch_size=args.batch_size,
+                    main_branch=args.branch,
+                    base_branch=args.base_branch,
+                    pull_request_id=args.pull_request_id
+                )
         
         # Summary
         elapsed = time.perf_counter() - start_time
@@ -213,6 +217,19 @@ def create_parser() -> argparse.ArgumentParser:
         help='Pull request ID for tracking (optional)'
     )
     
+    analyze_parser.add_argument(
+        '--parallel',
+        action='store_true',
+        help='Build the source cache with a process pool (LSP resolution stays sequential)'
+    )
+    
+    analyze_parser.add_argument(
+        '--analysis-workers',
+        type=int,
+        default=1,
+        help='Analyze files in this many processes, each with its own language server (default: 1)'
+    )
+    
     analyze_parser.add_argument(
         '--verbose', '-v',
         action='store_true',
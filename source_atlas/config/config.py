@@ -56,6 +56,7 @@ class Configs(BaseSettings):
     NEO4J_MAX_CONNECTION_LIFETIME: int = int(os.getenv("NEO4J_MAX_CONNECTION_LIFETIME", "30"))
     NEO4J_MAX_CONNECTION_POOL_SIZE: int = int(os.getenv("NEO4J_MAX_CONNECTION_POOL_SIZE", "50"))
     NEO4J_CONNECTION_TIMEOUT: float = float(os.getenv("NEO4J_CONNECTION_TIMEOUT", "30.0"))
+    NEO4J_IMPORT_MAX_WORKERS: int = int(os.getenv("NEO4J_IMPORT_MAX_WORKERS", "4"))
 
     class Config:
         case_sensitive = True
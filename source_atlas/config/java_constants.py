@@ -1,3 +1,4 @@
+import re
 from typing import Set
 
 class JavaBuiltinPackages:
@@ -7,6 +8,8 @@ class JavaBuiltinPackages:
         "ArrayList<","LinkedList<","HashSet<","TreeSet<","HashMap<","TreeMap","HashTable<","Vector<","Collections<",
         "Arrays<","Objects<"
     }
+    # Same prefixes as a tuple, for a single str.startswith() call
+    JAVA_EXCLUDE_TYPE_PREFIXES = tuple(JAVA_EXCLUDE_TYPE_FORMAT)
     JAVA_CORE_PACKAGES = {
         'java.lang',
         'java.util',
@@ -103,7 +106,7 @@ class JavaBuiltinPackages:
     }
 
     # All packages to exclude
-    ALL_BUILTIN_PACKAGES = (
+    ALL_BUILTIN_PACKAGES = frozenset(
             JAVA_CORE_PACKAGES |
             JAVA_EE_PACKAGES |
             SPRING_PACKAGES |
@@ -111,7 +114,7 @@ class JavaBuiltinPackages:
     )
 
     # Primitive types and wrapper classes
-    JAVA_PRIMITIVES = {
+    JAVA_PRIMITIVES = frozenset({
         # --- Primitive types ---
         "byte", "short", "int", "long",
         "float", "double", "char", "boolean", "void",
@@ -207,7 +210,7 @@ class JavaBuiltinPackages:
         "String[]", "Integer[]", "Double[]", "Float[]", "Long[]", "Short[]", "Byte[]", "Character[]", "Boolean[]", "Void[]", 
 
         "Class<T>", "Class<E>", "Class<K>", "Class<V>", "Class<N>", "Class<S>", "Class<I>", "Class<O>", "Class<P>", "Class<Q>", "Class<R>", "Class<U>", "Class<X>", "Class<Y>", "Class<Z>",
-    }
+    })
 
 
 class JavaParsingConstants:
@@ -219,6 +222,8 @@ class JavaParsingConstants:
 
     ENCODING_FALLBACKS = ['utf-8', 'latin-1', 'cp1252', 'iso-8859-1']
 
+    COMMENT_QUERY = "[(line_comment) (block_comment)] @comment"
+
     CONFIG_NODE_ANNOTATIONS = {
         # --- Class-level configuration ---
         "@Configuration",
@@ -263,6 +268,10 @@ class JavaParsingConstants:
         "@Value"                   # Generates: immutable class (final + getters + constructor)
     }
 
+    # Single-pass substring matchers over the sets above
+    CONFIG_NODE_ANNOTATIONS_RE = re.compile("|".join(map(re.escape, sorted(CONFIG_NODE_ANNOTATIONS))))
+    LOMBOK_METHOD_ANNOTATIONS_RE = re.compile("|".join(map(re.escape, sorted(LOMBOK_METHOD_ANNOTATIONS))))
+
     CONFIG_INTERFACES_CLASSES = {
         # Spring Boot Configuration
         "WebMVCConfigure",
@@ -345,4 +354,17 @@ class JavaCodeAnalyzerConstant:
         "*.sql", "*.yml", "*.yaml", "*.xml"
     }
 
-    JAVA_EXTENSION = "*.java"
+    JAVA_FILE_SUFFIX = ".java"
+
+    # A file containing none of these cannot declare a type (e.g. package-info.java, module-info.java)
+    TYPE_DECLARATION_KEYWORDS = (b"class", b"interface", b"enum", b"record")
+
+    # VCS and IDE directories; dotted names can't be Java packages, so these are skipped at any depth
+    EXCLUDED_DIRS = {
+        ".git", ".svn", ".hg", ".idea", ".vscode", ".gradle", ".mvn",
+    }
+
+    # Build output and dependencies; only skipped outside src/, where the same names are ordinary packages
+    BUILD_OUTPUT_DIRS = {
+        "target", "build", "dist", "node_modules",
+    }
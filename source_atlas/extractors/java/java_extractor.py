@@ -9,6 +9,7 @@ from source_atlas.extractors.java.spring_event_extractor import EventAnnotationE
 from source_atlas.extractors.java.springboot_annotation_extractor import SpringBootAnnotationExtractor
 from source_atlas.extractors.java.quarkus_extractor import QuarkusJaxRsExtractor
 from source_atlas.models.domain_models import RestEndpoint
+from source_atlas.utils.tree_sitter_helper import extract_content
 
 
 class JavaEndpointExtractor:
@@ -53,7 +54,7 @@ class JavaEndpointExtractor:
                     if grandchild.type != 'annotation' and grandchild.type != 'marker_annotation':
                         continue
 
-                    text = content[grandchild.start_byte:grandchild.end_byte]
+                    text = extract_content(grandchild, content)
 
                     for extractor in self.extractors:
                         if extractor.supports(text):
@@ -4,6 +4,7 @@ from typing import List
 from tree_sitter import Node
 
 from source_atlas.models.domain_models import RestEndpoint
+from source_atlas.utils.tree_sitter_helper import extract_content
 
 
 class QuarkusJaxRsConfig:
@@ -19,13 +20,16 @@ class QuarkusJaxRsConfig:
         '@OPTIONS': 'OPTIONS',
     }
 
+    # Single-pass substring matcher over the annotations above
+    JAX_RS_HTTP_METHODS_RE = re.compile("|".join(map(re.escape, sorted(JAX_RS_HTTP_METHODS))))
+
 
 class QuarkusJaxRsExtractor:
     """Extracts REST endpoints from Quarkus JAX-RS annotations."""
     
     def supports(self, text: str) -> bool:
         """Check if the annotation is a JAX-RS HTTP method annotation."""
-        return any(anno in text for anno in QuarkusJaxRsConfig.JAX_RS_HTTP_METHODS.keys())
+        return QuarkusJaxRsConfig.JAX_RS_HTTP_METHODS_RE.search(text) is not None
     
     def extract(self, text: str, class_node: Node, method_node: Node, content: str) -> List[RestEndpoint]:
         """
@@ -74,7 +78,7 @@ class QuarkusJaxRsExtractor:
                 if grandchild.type not in ('annotation', 'marker_annotation'):
                     continue
                 
-                annotation_text = content[grandchild.start_byte:grandchild.end_byte]
+                annotation_text = extract_content(grandchild, content)
                 if '@Path' in annotation_text:
                     return self._extract_path_value(annotation_text)
         
@@ -93,7 +97,7 @@ class QuarkusJaxRsExtractor:
                 if grandchild.type not in ('annotation', 'marker_annotation'):
                     continue
                 
-                annotation_text = content[grandchild.start_byte:grandchild.end_byte]
+                annotation_text = extract_content(grandchild, content)
                 if '@Path' in annotation_text:
                     return self._extract_path_value(annotation_text)
         
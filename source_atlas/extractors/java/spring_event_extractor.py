@@ -3,6 +3,7 @@ import re
 from typing import List
 
 from source_atlas.models.domain_models import RestEndpoint
+from source_atlas.utils.tree_sitter_helper import extract_content
 from tree_sitter import Node
 
 class EventAnnotationExtractor:
@@ -22,7 +23,7 @@ class EventAnnotationExtractor:
             # fallback: guess from method param
             for ch in method_node.children:
                 if ch.type == 'formal_parameters':
-                    params_src = content[ch.start_byte:ch.end_byte]
+                    params_src = extract_content(ch, content)
                     m = re.search(r'\(\s*([A-Za-z_][\w\.]*)\s+\w+', params_src)
                     if m:
                         classes = [m.group(1).split('.')[-1]]
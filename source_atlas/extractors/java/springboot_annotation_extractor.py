@@ -4,6 +4,7 @@ from typing import List
 from tree_sitter import Node
 
 from source_atlas.models.domain_models import RestEndpoint
+from source_atlas.utils.tree_sitter_helper import extract_content
 
 
 class SpringBootAnnotationConfig:
@@ -23,19 +24,16 @@ class SpringBootAnnotationConfig:
     REST_CONTROLLER = '@RestController'
     REST_CONTROLLER_ADVICE = '@RestControllerAdvice'
 
+    # Single-pass substring matcher for supports(): REST mappings plus @ExceptionHandler
+    SUPPORTED_ANNOTATIONS_RE = re.compile(
+        "|".join(map(re.escape, sorted([*SPRING_BOOT_REST_ANNOTATION, EXCEPTION_HANDLER]))))
+
 
 class SpringBootAnnotationExtractor:
     def supports(self, text: str) -> bool:
         """Check if annotation is a Spring REST endpoint annotation."""
-        # Support standard REST mappings
-        if any(anno in text for anno in SpringBootAnnotationConfig.SPRING_BOOT_REST_ANNOTATION.keys()):
-            return True
-        
-        # Support @ExceptionHandler
-        if SpringBootAnnotationConfig.EXCEPTION_HANDLER in text:
-            return True
-        
-        return False
+        # Standard REST mappings and @ExceptionHandler
+        return SpringBootAnnotationConfig.SUPPORTED_ANNOTATIONS_RE.search(text) is not None
 
     def extract(self, text: str, class_node: Node, method_node: Node, content: str) -> List[RestEndpoint]:
         """Extract Spring endpoint information."""
@@ -100,7 +98,7 @@ class SpringBootAnnotationExtractor:
                 if child.type == 'modifiers':
                     for grandchild in child.children:
                         if grandchild.type == 'annotation':
-                            t = content[grandchild.start_byte:grandchild.end_byte]
+                            t = extract_content(grandchild, content)
                             if '@RequestMapping' in t:
                                 m = re.search(r'(?:value\s*=\s*)?["\']([^"\']*)["\']', t)
                                 if m:
@@ -137,7 +135,7 @@ class SpringBootAnnotationExtractor:
                 if child.type == 'modifiers':
                     for grandchild in child.children:
                         if grandchild.type in ('annotation', 'marker_annotation'):
-                            annotations.append(content[grandchild.start_byte:grandchild.end_byte])
+                            annotations.append(extract_content(grandchild, content))
         return ' '.join(annotations)
     
     def _check_method_has_response_body(self, method_node: Node, content: str) -> bool:
@@ -149,7 +147,7 @@ class SpringBootAnnotationExtractor:
             if child.type == 'modifiers':
                 for grandchild in child.children:
                     if grandchild.type in ('annotation', 'marker_annotation'):
-                        annotation_text = content[grandchild.start_byte:grandchild.end_byte]
+                        annotation_text = extract_content(grandchild, content)
                         if SpringBootAnnotationConfig.RESPONSE_BODY in annotation_text:
                             return True
         return False
@@ -163,7 +161,7 @@ class SpringBootAnnotationExtractor:
             if child.type == 'modifiers':
                 for grandchild in child.children:
                     if grandchild.type in ('annotation', 'marker_annotation'):
-                        annotation_text = content[grandchild.start_byte:grandchild.end_byte]
+                        annotation_text = extract_content(grandchild, content)
                         if SpringBootAnnotationConfig.REST_CONTROLLER in annotation_text:
                             return True
         return False
@@ -176,7 +174,7 @@ class SpringBootAnnotationExtractor:
         # Look for return type in method declaration
         for child in method_node.children:
             if child.type in ('type_identifier', 'generic_type'):
-                type_text = content[child.start_byte:child.end_byte]
+                type_text = extract_content(child, content)
                 if 'Mono' in type_text or 'Flux' in type_text:
                     return True
         
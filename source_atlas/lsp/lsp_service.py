@@ -65,6 +65,19 @@ class LSPService(ABC):
         """
         return self.language_server.request_definition(file_path, line, column)
 
+    def batch_request_definition(
+        self, file_path: str, positions: List[Tuple[int, int]]
+    ) -> List[List[multilspy_types.Location]]:
+        """
+        Request symbol definition locations for several positions in one round trip.
+        
+        :param file_path: Path to the file
+        :param positions: (line, column) pairs, 0-based
+        :return: Definition locations for each position, in the order given; the exception
+                 for a position whose request failed
+        """
+        return self.language_server.batch_request_definition(file_path, positions)
+
     def request_hover(
         self, file_path: str, line: int, column: int
     ) -> List[multilspy_types.Location]:
@@ -77,6 +90,19 @@ class LSPService(ABC):
         :return: List of hover
         """
         return self.language_server.request_hover(file_path, line, column)
+
+    def batch_request_hover(
+        self, file_path: str, positions: List[Tuple[int, int]]
+    ) -> List[multilspy_types.Hover]:
+        """
+        Request symbol hover for several positions in one round trip.
+
+        :param file_path: Path to the file
+        :param positions: (line, column) pairs, 0-based
+        :return: Hover for each position (None where there is none), in the order given; the
+                 exception for a position whose request failed
+        """
+        return self.language_server.batch_request_hover(file_path, positions)
     
     def request_implementation(
         self, file_path: str, line: int, column: int
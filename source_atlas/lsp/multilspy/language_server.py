@@ -493,6 +493,25 @@ class LanguageServer:
 
         return ret
 
+    async def batch_request_definition(
+        self, relative_file_path: str, positions: List[Tuple[int, int]]
+    ) -> List[List[multilspy_types.Location]]:
+        """
+        Raise one [textDocument/definition](https://microsoft.github.io/language-server-protocol/specifications/lsp/3.17/specification/#textDocument_definition) request
+        per position, all in flight at once, and wait for every response.
+
+        :param relative_file_path: The relative path of the file that has the symbols
+        :param positions: (line, column) pairs of the symbols
+
+        :return List[List[multilspy_types.Location]]: Definition locations for each position, in the order given.
+            A position whose request failed gets the exception instead, so one failure doesn't lose the whole batch.
+        """
+        with self.open_file(relative_file_path):
+            return await asyncio.gather(
+                *(self.request_definition(relative_file_path, line, column) for line, column in positions),
+                return_exceptions=True,
+            )
+
     async def request_implementation(
         self, relative_file_path: str, line: int, column: int
     ) -> List[multilspy_types.Location]:
@@ -701,6 +720,25 @@ class LanguageServer:
 
         return multilspy_types.Hover(**response)
 
+    async def batch_request_hover(
+        self, relative_file_path: str, positions: List[Tuple[int, int]]
+    ) -> List[Union[multilspy_types.Hover, None]]:
+        """
+        Raise one [textDocument/hover](https://microsoft.github.io/language-server-protocol/specifications/lsp/3.17/specification/#textDocument_hover) request
+        per position, all in flight at once, and wait for every response.
+
+        :param relative_file_path: The relative path of the file that has the symbols
+        :param positions: (line, column) pairs of the symbols
+
+        :return List[Union[multilspy_types.Hover, None]]: Hover information for each position, in the order given.
+            A position whose request failed gets the exception instead, so one failure doesn't lose the whole batch.
+        """
+        with self.open_file(relative_file_path):
+            return await asyncio.gather(
+                *(self.request_hover(relative_file_path, line, column) for line, column in positions),
+                return_exceptions=True,
+            )
+
     async def request_workspace_symbol(self, query: str) -> Union[List[multilspy_types.UnifiedSymbolInformation], None]:
         """
         Raise a [workspace/symbol](https://microsoft.github.io/language-server-protocol/specifications/lsp/3.17/specification/#workspace_symbol) request to the Language Server
@@ -835,6 +873,19 @@ class SyncLanguageServer:
         return result
 
 
+    def batch_request_definition(
+        self, file_path: str, positions: List[Tuple[int, int]]
+    ) -> List[List[multilspy_types.Location]]:
+        """
+        Request textDocument/definition for several positions in one file, pipelined so that the
+        whole batch costs about one round trip. Results are aligned with positions; a position
+        whose request failed gets the exception instead.
+        """
+        result = asyncio.run_coroutine_threadsafe(
+            self.language_server.batch_request_definition(file_path, positions), self.loop
+        ).result(timeout=self.timeout)
+        return result
+
     def request_implementation(
         self, file_path: str, line: int, column: int
     ) -> List[multilspy_types.Location]:
@@ -911,6 +962,19 @@ class SyncLanguageServer:
         ).result(timeout=self.timeout)
         return result
 
+    def batch_request_hover(
+        self, relative_file_path: str, positions: List[Tuple[int, int]]
+    ) -> List[Union[multilspy_types.Hover, None]]:
+        """
+        Request textDocument/hover for several positions in one file, pipelined so that the
+        whole batch costs about one round trip. Results are aligned with positions; a position
+        whose request failed gets the exception instead.
+        """
+        result = asyncio.run_coroutine_threadsafe(
+            self.language_server.batch_request_hover(relative_file_path, positions), self.loop
+        ).result(timeout=self.timeout)
+        return result
+
     def request_workspace_symbol(self, query: str) -> Union[List[multilspy_types.UnifiedSymbolInformation], None]:
         """
         Raise a [workspace/symbol](https://microsoft.github.io/language-server-protocol/specifications/lsp/3.17/specification/#workspace_symbol) request to the Language Server
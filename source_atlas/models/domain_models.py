@@ -1,7 +1,9 @@
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
-from typing import List, Dict, Tuple, Optional
+from typing import Dict, Tuple, Optional
+
+from source_atlas.utils.common import DATACLASS_SLOTS
 
 @dataclass
 class Field:
@@ -28,12 +30,12 @@ class MethodParam:
 @dataclass
 class MethodCall:
     name: str = ""
-    params: List[MethodParam] = field(default_factory=list)
+    params: Tuple[MethodParam, ...] = field(default_factory=tuple)
 
     def to_dict(self):
         return {
             "name": self.name,
-            "params": self.params
+            "params": list(self.params)
         }
 
 class ChunkType(Enum):
@@ -46,7 +48,7 @@ class ChunkType(Enum):
     OVERRIDE = "override"
     CONFIGURATION = "configuration"
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Method:
     name: Optional[str]
     full_name: str
@@ -81,7 +83,7 @@ class Method:
             "annotations": list(self.annotations)
         }
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class CodeChunk:
     package: Optional[str]
     class_name: Optional[str]
@@ -90,7 +92,7 @@ class CodeChunk:
     content: str
     ast_hash: str
     implements: Tuple[str, ...]
-    methods: List[Method]
+    methods: Tuple[Method, ...]
     parent_class: Optional[str]
     project_id: str
     branch: str
@@ -116,7 +118,7 @@ class CodeChunk:
                 "body": method.body,
                 "ast_hash": method.ast_hash,
                 "method_calls": [{"name": method_call.name,
-                                  "params": method_call.params} for method_call in method.method_calls],
+                                  "params": list(method_call.params)} for method_call in method.method_calls],
                 "used_types": list(method.used_types),
                 "field_access": list(method.field_access),
                 "inheritance_info": list(method.inheritance_info),
@@ -145,7 +147,7 @@ class CodeChunk:
             content=file_path.read_text(),
             ast_hash="",  # Will be computed later
             implements=(),
-            methods=[],
+            methods=(),
             parent_class=None,
             type=ChunkType.CONFIGURATION,
             project_id=project_id,
@@ -1,11 +1,20 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Tuple, Optional
 
 from loguru import logger
+from neo4j.exceptions import ServiceUnavailable, SessionExpired, TransientError
 
+from source_atlas.config.config import configs
 from source_atlas.neo4jdb.neo4j_db import Neo4jDB
 from source_atlas.neo4jdb.neo4j_dto import Neo4jNodeDto, Neo4jPathDto, Neo4jTraversalResultDto
 from source_atlas.models.domain_models import CodeChunk, ChunkType
 
+# Errors worth running a query again for: transient server errors (e.g. deadlocks) and dropped connections
+_RETRYABLE_ERRORS = (TransientError, ServiceUnavailable, SessionExpired)
+# First backoff delay when a query hits one of them; doubles per retry
+_RETRY_BASE_DELAY_SECONDS = 0.2
+
 
 def _escape_for_cypher(text):
     if text is None:
@@ -142,9 +151,12 @@ class Neo4jService:
                                     version: Optional[str] = None,
                                     base_version: Optional[str] = None,
                                     deleted_nodes: Optional[List[Dict]] = None) -> \
-            List[Tuple[str, Dict]]:
+            Tuple[List[Tuple[str, Dict]], List[Tuple[str, Dict]]]:
         """
         Generate Cypher queries from code chunks with branch-aware support.
+
+        Returns node queries (tombstones, deletes, creates) and relationship queries as
+        separate lists; relationships MATCH nodes, so the first list has to run first.
         
         New parameters for branch-aware design:
             version: Current commit hash/version for this import
@@ -152,7 +164,7 @@ class Neo4jService:
             deleted_nodes: List of deleted node info (for creating tombstones)
                           Each dict should have: {'class_name': str, 'method_name': str or None, 'ast_hash': str}
         """
-        all_queries = []
+        node_queries = []
 
         # Step 1: Create tombstone nodes for deleted entities (if any)
         if deleted_nodes:
@@ -201,7 +213,7 @@ class Neo4jService:
                 }) YIELD node
                 RETURN count(node) AS created_count
                 """
-                all_queries.append((tombstone_query, {'tombstones': tombstone_data}))
+                node_queries.append((tombstone_query, {'tombstones': tombstone_data}))
         
         # Step 2: Process regular nodes (classes and methods)
         for i in range(0, len(chunks), batch_size):
@@ -311,7 +323,7 @@ class Neo4jService:
                     WHERE n.method_name IS NULL AND n.pull_request_id IS NULL
                     DETACH DELETE n
                     """
-                    all_queries.append((delete_class_query, {'nodes': class_nodes_to_delete}))
+                    node_queries.append((delete_class_query, {'nodes': class_nodes_to_delete}))
 
                 if method_nodes_to_delete:
                     # Delete method nodes by branch only
@@ -321,7 +333,7 @@ class Neo4jService:
                     WHERE n.method_name IS NOT NULL AND n.pull_request_id IS NULL
                     DETACH DELETE n
                     """
-                    all_queries.append((delete_method_query, {'nodes': method_nodes_to_delete}))
+                    node_queries.append((delete_method_query, {'nodes': method_nodes_to_delete}))
 
 
             # Create new nodes with branch-aware properties
@@ -368,7 +380,7 @@ class Neo4jService:
                 }) YIELD node AS created_node
                 RETURN count(created_node) AS created_count
                 """
-                all_queries.append(
+                node_queries.append(
                     (batch_query, {'nodes': node_data, 'main_branch': main_branch, 'base_branch': base_branch}))
             elif main_branch:
                 # Fallback logic khi chỉ có main_branch
@@ -399,7 +411,7 @@ class Neo4jService:
                 }) YIELD node AS created_node
                 RETURN count(created_node)
                 """
-                all_queries.append((batch_query, {'nodes': node_data, 'main_branch': main_branch}))
+                node_queries.append((batch_query, {'nodes': node_data, 'main_branch': main_branch}))
             else:
                 batch_query = """
                 UNWIND $nodes AS node
@@ -421,9 +433,10 @@ class Neo4jService:
                 }) YIELD node AS created_node
                 RETURN count(created_node)
                 """
-                all_queries.append((batch_query, {'nodes': node_data}))
+                node_queries.append((batch_query, {'nodes': node_data}))
 
         # Relationships
+        relationship_queries = []
         for i in range(0, len(chunks), batch_size):
             batch = chunks[i:i + batch_size]
             call_rels = []
@@ -554,7 +567,7 @@ class Neo4jService:
                         WHERE target IS NOT NULL
                         MERGE (source)-[:CALL]->(target)
                         """
-                        all_queries.append((call_query, {'relationships': call_rels, 'base_branch': base_branch,
+                        relationship_queries.append((call_query, {'relationships': call_rels, 'base_branch': base_branch,
                                                          'main_branch': main_branch}))
                     else:
                         # Only main_branch, no base_branch
@@ -566,7 +579,7 @@ class Neo4jService:
                         WHERE target IS NOT NULL
                         MERGE (source)-[:CALL]->(target)
                         """
-                        all_queries.append((call_query, {'relationships': call_rels, 'main_branch': main_branch}))
+                        relationship_queries.append((call_query, {'relationships': call_rels, 'main_branch': main_branch}))
                 else:
                     call_query = """
                     UNWIND $relationships AS rel
@@ -574,7 +587,7 @@ class Neo4jService:
                     MATCH (target {method_name: rel.target_method, project_id: rel.project_id, branch: rel.branch})
                     MERGE (source)-[:CALL]->(target)
                     """
-                    all_queries.append((call_query, {'relationships': call_rels}))
+                    relationship_queries.append((call_query, {'relationships': call_rels}))
 
 
             if implement_rels:
@@ -597,7 +610,7 @@ class Neo4jService:
                         WHERE target IS NOT NULL
                         MERGE (source)-[:IMPLEMENT]->(target)
                         """
-                        all_queries.append((class_implement_query,
+                        relationship_queries.append((class_implement_query,
                                             {'relationships': class_implement_rels, 'base_branch': base_branch,
                                              'main_branch': main_branch}))
                     else:
@@ -609,7 +622,7 @@ class Neo4jService:
                         WHERE target.method_name IS NULL
                         MERGE (source)-[:IMPLEMENT]->(target)
                         """
-                        all_queries.append((class_implement_query, {'relationships': class_implement_rels}))
+                        relationship_queries.append((class_implement_query, {'relationships': class_implement_rels}))
 
                 method_implement_rels = [rel for rel in implement_rels if 'source_method' in rel]
                 if method_implement_rels:
@@ -626,7 +639,7 @@ class Neo4jService:
                         WHERE target IS NOT NULL
                         MERGE (source)-[:IMPLEMENT]->(target)
                         """
-                        all_queries.append((method_implement_query,
+                        relationship_queries.append((method_implement_query,
                                             {'relationships': method_implement_rels, 'base_branch': base_branch,
                                              'main_branch': main_branch}))
                     else:
@@ -636,7 +649,7 @@ class Neo4jService:
                         MATCH (target {class_name: rel.target_class, method_name: rel.target_method, project_id: rel.project_id, branch: rel.branch})
                         MERGE (source)-[:IMPLEMENT]->(target)
                         """
-                        all_queries.append((method_implement_query, {'relationships': method_implement_rels}))
+                        relationship_queries.append((method_implement_query, {'relationships': method_implement_rels}))
 
             if use_rels:
                 # Separate class-level and method-level USE relationships
@@ -658,7 +671,7 @@ class Neo4jService:
                         WHERE target IS NOT NULL
                         MERGE (source)-[:USE]->(target)
                         """
-                        all_queries.append(
+                        relationship_queries.append(
                             (class_use_query, {'relationships': class_use_rels, 'base_branch': base_branch,
                                                'main_branch': main_branch}))
                     else:
@@ -670,7 +683,7 @@ class Neo4jService:
                                 WHERE target.method_name IS NULL
                                 MERGE (source)-[:USE]->(target)
                                 """
-                        all_queries.append((class_use_query, {'relationships': class_use_rels}))
+                        relationship_queries.append((class_use_query, {'relationships': class_use_rels}))
 
                 # Handle method-level USE relationships
                 if method_use_rels:
@@ -686,7 +699,7 @@ class Neo4jService:
                         WHERE target IS NOT NULL
                         MERGE (source)-[:USE]->(target)
                         """
-                        all_queries.append(
+                        relationship_queries.append(
                             (method_use_query, {'relationships': method_use_rels, 'base_branch': base_branch,
                                                 'main_branch': main_branch}))
                     else:
@@ -697,10 +710,10 @@ class Neo4jService:
                         WHERE target.method_name IS NULL
                         MERGE (source)-[:USE]->(target)
                         """
-                        all_queries.append((method_use_query, {'relationships': method_use_rels}))
+                        relationship_queries.append((method_use_query, {'relationships': method_use_rels}))
 
 
-        return all_queries
+        return node_queries, relationship_queries
 
     def copy_unchanged_nodes_from_main(
             self,
@@ -1119,18 +1132,29 @@ class Neo4jService:
         raise e
 
     def execute_queries_batch(self, queries_with_params: List[Tuple[str, Dict]], max_retries: int = 3):
+        """
+        Run queries in order in one session.
+
+        Transient errors and dropped connections are retried with exponential backoff:
+        concurrent shards DETACH DELETE and MERGE shared nodes, so deadlocks between them
+        are expected, and the session reconnects on its next query. Any other error is
+        raised right away.
+        """
         with self.db.driver.session() as session:
-            for i, (query, params) in enumerate(queries_with_params):
+            for query, params in queries_with_params:
                 retry_count = 0
-                while retry_count < max_retries:
+                while True:
                     try:
                         result = session.run(query, params)
                         result.consume()
                         break
-                    except Exception as e:
+                    except _RETRYABLE_ERRORS as e:
                         retry_count += 1
                         if retry_count >= max_retries:
-                            raise e
+                            raise
+                        delay = _RETRY_BASE_DELAY_SECONDS * 2 ** (retry_count - 1)
+                        logger.debug("Retrying query in {:.1f}s after {}: {}", delay, type(e).__name__, e)
+                        time.sleep(delay)
 
     def import_code_chunks(self, chunks: List[CodeChunk], batch_size: int = 500, main_branch: Optional[str] = None,
                            base_branch: Optional[str] = None, pull_request_id: Optional[str] = None,
@@ -1232,7 +1256,8 @@ class Neo4jService:
                                   pull_request_id: Optional[str] = None,
                                   version: Optional[str] = None,
                                   base_version: Optional[str] = None,
-                                  deleted_nodes: Optional[List[Dict]] = None):
+                                  deleted_nodes: Optional[List[Dict]] = None,
+                                  max_workers: Optional[int] = None):
         """
         Simple import without relationship preservation, with branch-aware support.
         
@@ -1242,6 +1267,10 @@ class Neo4jService:
         - Cases where you don't need to preserve relationships between unchanged and changed nodes
         
         For incremental updates where relationship preservation is important, use import_code_chunks() instead.
+
+        Chunks are split into contiguous shards and each shard is written by its own session on a
+        thread pool, so bolt round-trips overlap with server-side writes. All node queries finish
+        before any relationship query starts, because relationships MATCH nodes from every shard.
         
         Args:
             chunks: List of code chunks to import
@@ -1252,18 +1281,51 @@ class Neo4jService:
             version: Current version/commit hash for this import
             base_version: Base version when feature branch was created
             deleted_nodes: List of deleted node info (for tombstone creation)
+            max_workers: Number of concurrent sessions (defaults to NEO4J_IMPORT_MAX_WORKERS)
         """
         if not chunks:
             logger.warning("No chunks to import")
             return
             
         self.create_indexes()
-        queries_with_params = self.generate_cypher_from_chunks(
-            chunks, batch_size, main_branch, base_branch, pull_request_id,
-            version=version, base_version=base_version, deleted_nodes=deleted_nodes
-        )
-        self.execute_queries_batch(queries_with_params)
-        logger.info(f"✅ Imported {len(chunks)} chunks (simple mode)")
+
+        max_workers = max(1, min(max_workers or configs.NEO4J_IMPORT_MAX_WORKERS, len(chunks)))
+        shard_size = -(-len(chunks) // max_workers)
+        node_shards, relationship_shards = [], []
+        for shard_index, start in enumerate(range(0, len(chunks), shard_size)):
+            node_queries, relationship_queries = self.generate_cypher_from_chunks(
+                chunks[start:start + shard_size], batch_size, main_branch, base_branch, pull_request_id,
+                version=version, base_version=base_version,
+                # Tombstones are created once, by the first shard only
+                deleted_nodes=deleted_nodes if shard_index == 0 else None
+            )
+            node_shards.append(node_queries)
+            relationship_shards.append(relationship_queries)
+
+        self.execute_queries_concurrently(node_shards, max_workers)
+        self.execute_queries_concurrently(relationship_shards, max_workers)
+        logger.info(f"✅ Imported {len(chunks)} chunks (simple mode, {len(node_shards)} shards)")
+
+    def execute_queries_concurrently(self, query_shards: List[List[Tuple[str, Dict]]], max_workers: int,
+                                     max_retries: int = 3):
+        """
+        Run each shard of queries in its own session on a bounded thread pool.
+
+        Queries inside a shard keep their order; shards run independently of each other.
+        Waits for every shard and re-raises the first failure.
+        """
+        query_shards = [shard for shard in query_shards if shard]
+        if not query_shards:
+            return
+        if len(query_shards) == 1 or max_workers <= 1:
+            for shard in query_shards:
+                self.execute_queries_batch(shard, max_retries)
+            return
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(query_shards))) as executor:
+            futures = [executor.submit(self.execute_queries_batch, shard, max_retries) for shard in query_shards]
+            for future in futures:
+                future.result()
 
 
     def import_changed_chunk_nodes_only(self, chunks: List[CodeChunk], main_branch: str, base_branch: str = None,
@@ -1273,8 +1335,9 @@ class Neo4jService:
 
         self.create_indexes()
 
-        # Generate queries with base_branch and main_branch comparison to filter by ast_hash
-        queries_with_params = self.generate_cypher_from_chunks(
+        # Generate queries with base_branch and main_branch comparison to filter by ast_hash;
+        # only node creation queries run here, relationships are created later
+        node_queries, _ = self.generate_cypher_from_chunks(
             chunks,
             batch_size,
             main_branch=main_branch,  # Pass main_branch for ast_hash comparison
@@ -1285,13 +1348,6 @@ class Neo4jService:
             deleted_nodes=deleted_nodes  # Pass deleted nodes for tombstone creation
         )
 
-        # Filter to only include node creation queries (not relationship queries)
-        node_queries = []
-        for query, params in queries_with_params:
-            # Skip relationship queries (they contain MERGE with relationship patterns)
-            if '-[' not in query and 'MERGE (source)-[' not in query:
-                node_queries.append((query, params))
-
         self.execute_queries_batch(node_queries)
         logger.info(
             f"Imported changed chunk nodes with different ast_hash from main branch (relationships will be created later)")
@@ -1299,7 +1355,7 @@ class Neo4jService:
     def import_changed_chunk_relationships(self, chunks: List[CodeChunk], current_branch: str, main_branch: str = None,
                                            base_branch: str = None, batch_size: int = 500, version: str = None):
 
-        queries_with_params = self.generate_cypher_from_chunks(
+        _, relationship_queries = self.generate_cypher_from_chunks(
             chunks,
             batch_size,
             main_branch=main_branch,
@@ -1308,14 +1364,6 @@ class Neo4jService:
             version=version  # Pass version for branch-aware relationships
         )
 
-        # Filter to only include relationship queries
-        relationship_queries = []
-        for query, params in queries_with_params:
-            # Only include relationship queries (they contain MERGE with relationship patterns or relationship keywords)
-            if any(keyword in query for keyword in
-                   ['MERGE (source)-[', 'MERGE (target)-[', ']->(target)', 'CALL]', 'IMPLEMENT]', 'USE]', 'EXTEND]']):
-                relationship_queries.append((query, params))
-
         self.execute_queries_batch(relationship_queries)
         logger.info(f"Imported relationships for {len(chunks)} changed chunks")
 
@@ -1504,7 +1552,7 @@ class Neo4jService:
                 # logger.info(f"Retrieved {len(nodes)} nodes with query: {query}")
                 return nodes
         except Exception as e:
-            logger.error(f"Failed to get nodes by condition: {str(e)}", exc_info=True)
+            logger.opt(exception=e).error("Failed to get nodes by condition: {}", e)
         raise
 
     def get_config_nodes(self, project_id: int, branch: str) -> List[Neo4jNodeDto]:
@@ -0,0 +1,79 @@
+"""
+Source Atlas - Programmatic pipeline runner.
+
+This module runs the full analyze -> export -> Neo4j import pipeline in a single
+call, so scripts share one code path.
+"""
+
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator
+
+from loguru import logger
+
+from source_atlas.analyzers.analyzer_factory import AnalyzerFactory
+from source_atlas.neo4jdb.neo4j_db import Neo4jDB
+from source_atlas.neo4jdb.neo4j_service import Neo4jService
+
+
+@contextmanager
+def timed(message: str, log=logger) -> Iterator[None]:
+    """
+    Log how long the wrapped block took, once it completes successfully.
+
+    Args:
+        message: Log message prefix, e.g. "Imported 10 chunks"
+        log: Logger to write to; anything with an info method, such as the CLI's stdlib logger
+    """
+    start_time = time.perf_counter()
+    yield
+    log.info(f"{message} in {time.perf_counter() - start_time:.2f} seconds")
+
+
+def run(args: Dict[str, Any]) -> int:
+    """
+    Analyze a project, export its chunks and import them into Neo4j.
+
+    Args:
+        args: Pipeline options. Required keys: project_path, project_id, language.
+              Optional keys: branch, output, batch_size, skip_neo4j, parallel,
+              analysis_workers, neo4j_url, neo4j_user, neo4j_password.
+
+    Returns:
+        Exit code (0 for success, 1 for error)
+    """
+    project_path = Path(args["project_path"])
+    try:
+        with timed("Analysis completed successfully"):
+            # AnalyzerFactory caches analyzers, so repeat runs in one process reuse them
+            analyzer = AnalyzerFactory.create_analyzer(args["language"], str(project_path), args["project_id"],
+                                                       args.get("branch", "main"))
+            with analyzer as a:
+                chunks = a.parse_project(project_path, parallel=args.get("parallel", False),
+                                         analysis_workers=args.get("analysis_workers", 1))
+
+            logger.info(f"Found {len(chunks)} classes/interfaces/enums")
+            if args.get("output"):
+                analyzer.export_chunks(chunks, Path(args["output"]))
+
+            if not args.get("skip_neo4j"):
+                logger.info("Importing chunks to Neo4j...")
+                db = Neo4jDB(
+                    url=args.get("neo4j_url"),
+                    user=args.get("neo4j_user"),
+                    password=args.get("neo4j_password")
+                )
+                try:
+                    with timed(f"Imported {len(chunks)} chunks to Neo4j"):
+                        Neo4jService(db=db).import_code_chunks_simple(
+                            chunks=chunks,
+                            batch_size=args.get("batch_size", 2000)
+                        )
+                finally:
+                    db.close()
+        return 0
+
+    except Exception as e:
+        logger.opt(exception=e).error("Error analyzing project: {}", e)
+        return 1
@@ -1,42 +1,130 @@
-from dataclasses import asdict, is_dataclass
+import json
+import os
+import re
+import sys
+from dataclasses import fields, is_dataclass
 from enum import Enum
 
 from pathlib import Path
+from typing import AbstractSet, Any, Callable, Dict, Iterable, List
+
+try:
+    import orjson
+except ImportError:  # optional speedup, see the "fast" extra
+    orjson = None
+
+# dataclass(**DATACLASS_SLOTS) drops the per-instance __dict__ where supported (Python 3.10+)
+DATACLASS_SLOTS: Dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+_SCALAR_TYPES = frozenset({str, int, float, bool, type(None)})
+
+_WHITESPACE_RE = re.compile(r'\s+')
+# Applied after whitespace is collapsed, so a single space is all there is to remove
+_BRACKET_SPACE_RE = re.compile(r'([(<]) | ([)>])')
+
+# Per-dataclass converters, generated once per class by _compile_dataclass_converter
+_dataclass_converters: Dict[type, Callable[[Any], dict]] = {}
+
+
+def _compile_dataclass_converter(cls: type) -> Callable[[Any], dict]:
+    """Generate a function that converts one instance of cls with a direct attribute read per field."""
+    items = ", ".join(f"{f.name!r}: convert(obj.{f.name})" for f in fields(cls))
+    namespace = {"convert": convert}
+    exec(f"def convert_{cls.__name__}(obj):\n    return {{{items}}}\n", namespace)
+    return namespace[f"convert_{cls.__name__}"]
 
 
 def convert(obj):
+    """Convert dataclasses, enums and containers into JSON-serializable builtins."""
+    obj_type = type(obj)
+    if obj_type in _SCALAR_TYPES:
+        return obj
+    converter = _dataclass_converters.get(obj_type)
+    if converter is not None:
+        return converter(obj)
     if isinstance(obj, Enum):
         return obj.value
-    if is_dataclass(obj):
-        return {k: convert(v) for k, v in asdict(obj).items()}
-    if isinstance(obj, list):
+    if is_dataclass(obj) and not isinstance(obj, type):
+        converter = _dataclass_converters[obj_type] = _compile_dataclass_converter(obj_type)
+        return converter(obj)
+    if isinstance(obj, (list, tuple)):
         return [convert(v) for v in obj]
     if isinstance(obj, dict):
         return {k: convert(v) for k, v in obj.items()}
     return obj
 
 
+def write_json_array(items: Iterable[Any], file_path: Path) -> None:
+    """
+    Stream items to file_path as a UTF-8 JSON array, one compact item per line.
+
+    Items are serialized one at a time, so only a single item's JSON is held in memory.
+    With orjson installed, dataclasses and enums are serialized natively (convert()
+    handles anything else); otherwise each item goes through convert() + json.dumps.
+    """
+    if orjson is not None:
+        def dumps(item: Any) -> bytes:
+            return orjson.dumps(item, default=convert, option=orjson.OPT_NON_STR_KEYS)
+    else:
+        def dumps(item: Any) -> bytes:
+            return json.dumps(convert(item), ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+    with open(file_path, "wb") as f:
+        f.write(b"[")
+        separator = b"\n"
+        for item in items:
+            f.write(separator)
+            f.write(dumps(item))
+            separator = b",\n"
+        f.write(b"\n]\n")
+
+
 def normalize_whitespace(text):
-    # Use regex to replace one or more whitespace characters with a single space
-    import re
-    # First, normalize all whitespace to single spaces
-    text = re.sub(r'\s+', ' ', text).strip()
-    # Then, remove spaces after '('
-    text = re.sub(r'\(\s+', '(', text)
-    # Remove spaces before ')'
-    text = re.sub(r'\s+\)', ')', text)
-    # Remove spaces after '<'
-    text = re.sub(r'<\s+', '<', text)
-    # Remove spaces before '>'
-    text = re.sub(r'\s+>', '>', text)
-    return text
-
-
-def read_file_content(file_path: Path) -> str:
-    """Read file content with encoding fallback."""
-    try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            return f.read()
-    except UnicodeDecodeError:
-        with open(file_path, 'r', encoding='latin1') as f:
-            return f.read()
+    # Identifiers and most signatures contain no whitespace at all, and then every rule below is a no-op
+    if _WHITESPACE_RE.search(text) is None:
+        return text
+    # Collapse whitespace runs to single spaces, then drop the space after '(' / '<' and before ')' / '>'
+    text = _WHITESPACE_RE.sub(' ', text).strip()
+    return _BRACKET_SPACE_RE.sub(r'\1\2', text)
+
+
+def read_file_bytes(file_path: Path) -> bytes:
+    """Read raw file content without decoding."""
+    # Unbuffered: read() sizes its buffer from fstat and fetches the file in one call, with no
+    # intermediate BufferedReader copy
+    with open(file_path, 'rb', buffering=0) as f:
+        return f.read()
+
+
+def find_files(root: Path, suffix: str, excluded_dirs: AbstractSet[str] = frozenset(),
+               output_dirs: AbstractSet[str] = frozenset()) -> List[Path]:
+    """
+    Recursively collect files ending with suffix.
+
+    excluded_dirs are never descended into. output_dirs (build output such as target/)
+    are skipped only outside any src directory: below it, a package may have the same name.
+    """
+    files = []
+    # Scan with os.scandir directly: only matching entries become Path objects, and the
+    # cached dirent type answers is_dir() without a stat on most filesystems
+    pending = [(os.fspath(root), False)]
+    while pending:
+        directory, in_sources = pending.pop()
+        sub_dirs = []
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        name = entry.name
+                        # Like os.walk, don't descend into symlinked directories
+                        if (name in excluded_dirs or (not in_sources and name in output_dirs)
+                                or entry.is_symlink()):
+                            continue
+                        sub_dirs.append((entry.path, in_sources or name == "src"))
+                    elif entry.name.endswith(suffix):
+                        files.append(Path(entry.path))
+        except OSError:
+            continue
+        # Reversed so directories are visited in the same top-down order as os.walk
+        pending.extend(reversed(sub_dirs))
+    return files
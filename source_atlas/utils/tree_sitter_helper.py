@@ -1,5 +1,64 @@
+from typing import Dict, Tuple
+
 from tree_sitter import Node
 
 
 def extract_content(node: Node, content: str) -> str:
-    return content[node.start_byte:node.end_byte]
\ No newline at end of file
+    # Node offsets are UTF-8 byte offsets, so slicing the str only works for ASCII sources.
+    # Trees parsed from bytes keep their source, so take the node's own bytes instead.
+    text = node.text
+    if text is None:
+        return content[node.start_byte:node.end_byte]
+    return text.decode("utf-8")
+
+
+def _common_prefix_length(a: bytes, b: bytes) -> int:
+    # Binary search; b is sliced through a memoryview so no step copies either source,
+    # and bytes.startswith compares against the view with a single memcmp
+    view = memoryview(b)
+    lo, hi = 0, min(len(a), len(b))
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if a.startswith(view[:mid]):
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+
+def _common_suffix_length(a: bytes, b: bytes, limit: int) -> int:
+    view = memoryview(b)
+    lo, hi = 0, limit
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if a.endswith(view[len(b) - mid:]):
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+
+def _point_at(source: bytes, offset: int) -> Tuple[int, int]:
+    row = source.count(b'\n', 0, offset)
+    return row, offset - (source.rfind(b'\n', 0, offset) + 1)
+
+
+def compute_edit(old_source: bytes, new_source: bytes) -> Dict[str, object]:
+    """
+    Describe the change from old_source to new_source as a single tree-sitter edit.
+
+    The edited range is everything between the common prefix and the common suffix,
+    and the result can be passed straight to Tree.edit(**edit).
+    """
+    start = _common_prefix_length(old_source, new_source)
+    suffix = _common_suffix_length(old_source, new_source, min(len(old_source), len(new_source)) - start)
+    old_end = len(old_source) - suffix
+    new_end = len(new_source) - suffix
+    return {
+        "start_byte": start,
+        "old_end_byte": old_end,
+        "new_end_byte": new_end,
+        "start_point": _point_at(old_source, start),
+        "old_end_point": _point_at(old_source, old_end),
+        "new_end_point": _point_at(new_source, new_end),
+    }
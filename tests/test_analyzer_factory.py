@@ -0,0 +1,43 @@
+"""
+Unit tests for the analyzer cache in source_atlas.analyzers.analyzer_factory.
+"""
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from source_atlas.analyzers import analyzer_factory
+from source_atlas.analyzers.analyzer_factory import AnalyzerFactory
+
+
+class _StubAnalyzer:
+    """Analyzer stand-in that does not start a language server."""
+
+    def __init__(self, root_path, project_id, branch):
+        self.project_id = project_id
+
+
+class TestAnalyzerCache:
+    """Test reuse and eviction of cached analyzers."""
+
+    def setup_method(self):
+        AnalyzerFactory.clear_cache()
+
+    def teardown_method(self):
+        AnalyzerFactory.clear_cache()
+
+    def test_least_recently_used_analyzers_are_released(self, monkeypatch):
+        monkeypatch.setattr(analyzer_factory, "JavaCodeAnalyzer", _StubAnalyzer)
+        first = AnalyzerFactory.create_analyzer("java", "/repo", "0")
+        for project_id in range(1, analyzer_factory._ANALYZER_CACHE_SIZE):
+            AnalyzerFactory.create_analyzer("java", "/repo", str(project_id))
+
+        # Using the first analyzer again makes the second one the eviction candidate
+        assert AnalyzerFactory.create_analyzer("Java", "/repo", "0") is first
+        AnalyzerFactory.create_analyzer("java", "/repo", "new")
+
+        assert len(analyzer_factory._analyzer_cache) == analyzer_factory._ANALYZER_CACHE_SIZE
+        assert ("java", "/repo", "1", None) not in analyzer_factory._analyzer_cache
+        assert AnalyzerFactory.create_analyzer("java", "/repo", "0") is first
@@ -0,0 +1,152 @@
+"""
+Unit tests for the shared helpers in source_atlas.utils.common.
+"""
+import json
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from source_atlas.models.domain_models import ChunkType, Method, MethodCall
+from source_atlas.utils import common
+from source_atlas.utils.common import convert, find_files, normalize_whitespace, read_file_bytes, write_json_array
+
+
+class TestFindFiles:
+    """Test recursive source file discovery."""
+
+    def test_skips_excluded_directories(self, tmp_path):
+        (tmp_path / "src" / "main" / "java").mkdir(parents=True)
+        (tmp_path / "target" / "generated").mkdir(parents=True)
+        (tmp_path / "src" / "main" / "java" / "App.java").write_text("class App {}")
+        (tmp_path / "target" / "generated" / "Gen.java").write_text("class Gen {}")
+        (tmp_path / "README.md").write_text("docs")
+
+        files = find_files(tmp_path, ".java", {"target"})
+
+        assert [f.name for f in files] == ["App.java"]
+
+    def test_build_output_names_are_packages_below_src(self, tmp_path):
+        package = tmp_path / "module" / "src" / "main" / "java" / "com" / "acme"
+        for name in ("build", "dist"):
+            (package / name).mkdir(parents=True)
+            (package / name / f"{name.title()}.java").write_text("class X {}")
+        (tmp_path / "module" / "target" / "generated").mkdir(parents=True)
+        (tmp_path / "module" / "target" / "generated" / "Gen.java").write_text("class Gen {}")
+        (tmp_path / ".git").mkdir()
+        (tmp_path / ".git" / "Stash.java").write_text("class Stash {}")
+
+        files = find_files(tmp_path, ".java", {".git"}, {"target", "build", "dist"})
+
+        assert sorted(f.name for f in files) == ["Build.java", "Dist.java"]
+
+    def test_without_exclusions_finds_all_matches(self, tmp_path):
+        (tmp_path / "a").mkdir()
+        (tmp_path / "a" / "One.java").write_text("class One {}")
+        (tmp_path / "Two.java").write_text("class Two {}")
+
+        files = find_files(tmp_path, ".java")
+
+        assert sorted(f.name for f in files) == ["One.java", "Two.java"]
+
+    def test_does_not_follow_directory_symlinks(self, tmp_path):
+        (tmp_path / "real").mkdir()
+        (tmp_path / "real" / "One.java").write_text("class One {}")
+        (tmp_path / "link").symlink_to(tmp_path / "real", target_is_directory=True)
+
+        files = find_files(tmp_path, ".java")
+
+        assert files == [tmp_path / "real" / "One.java"]
+
+
+class TestReadFileBytes:
+    """Test raw source reads."""
+
+    def test_returns_undecoded_content(self, tmp_path):
+        path = tmp_path / "App.java"
+        path.write_bytes("class Caf\u00e9 {}".encode("utf-8"))
+
+        assert read_file_bytes(path) == "class Caf\u00e9 {}".encode("utf-8")
+
+    def test_empty_file(self, tmp_path):
+        path = tmp_path / "Empty.java"
+        path.write_bytes(b"")
+
+        assert read_file_bytes(path) == b""
+
+
+class TestNormalizeWhitespace:
+    """Test signature whitespace normalization."""
+
+    def test_collapses_and_tightens_brackets(self):
+        assert normalize_whitespace("  save( \n final  Map< K,\tV >  m  )\n") == "save(final Map<K, V> m)"
+
+    def test_text_without_whitespace_is_returned_as_is(self):
+        assert normalize_whitespace("save(int)") == "save(int)"
+
+
+class TestConvert:
+    """Test dataclass/enum conversion used by chunk export."""
+
+    def test_nested_dataclasses_and_enums(self):
+        method = Method(
+            name="run()",
+            full_name="com.example.App.run()",
+            body="void run() {}",
+            ast_hash="hash",
+            method_calls=(MethodCall(name="com.example.Dep.call()"),),
+            used_types=("com.example.Dep",),
+            field_access=(),
+            inheritance_info=(),
+            endpoint=(),
+            type=ChunkType.REGULAR,
+            project_id="1",
+            branch="main"
+        )
+
+        result = convert(method)
+
+        assert result["type"] == "regular"
+        assert result["method_calls"] == [{"name": "com.example.Dep.call()", "params": []}]
+        assert result["used_types"] == ["com.example.Dep"]
+        assert list(result) == [
+            "name", "full_name", "body", "ast_hash", "method_calls", "used_types", "field_access",
+            "inheritance_info", "endpoint", "type", "project_id", "branch", "handles_annotation", "annotations"
+        ]
+
+    def test_plain_values_pass_through(self):
+        assert convert({"a": [1, "x", None]}) == {"a": [1, "x", None]}
+
+
+class TestWriteJsonArray:
+    """Test streaming chunk export, with and without orjson."""
+
+    def _sample(self):
+        return [MethodCall(name="com.example.Caf\u00e9.call()"), {"type": ChunkType.CONFIGURATION}]
+
+    def test_writes_converted_data(self, tmp_path):
+        path = tmp_path / "chunks.json"
+
+        write_json_array(self._sample(), path)
+
+        assert json.loads(path.read_text(encoding="utf-8")) == convert(self._sample())
+        assert len(path.read_text(encoding="utf-8").splitlines()) == 4
+
+    def test_empty(self, tmp_path):
+        path = tmp_path / "chunks.json"
+
+        write_json_array(iter(()), path)
+
+        assert json.loads(path.read_text(encoding="utf-8")) == []
+
+    def test_stdlib_fallback_matches(self, tmp_path, monkeypatch):
+        fast_path = tmp_path / "fast.json"
+        fallback_path = tmp_path / "fallback.json"
+        write_json_array(self._sample(), fast_path)
+
+        monkeypatch.setattr(common, "orjson", None)
+        write_json_array(self._sample(), fallback_path)
+
+        assert fast_path.read_bytes() == fallback_path.read_bytes()
@@ -0,0 +1,767 @@
+"""
+Unit tests for tree-sitter based JavaCodeAnalyzer helpers that need no language server.
+"""
+import contextlib
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from loguru import logger
+
+from source_atlas.analyzers import base_analyzer
+from source_atlas.analyzers.java_analyzer import JavaCodeAnalyzer, _FileCache
+
+
+def _class_nodes(analyzer, source):
+    tree = analyzer.parser.parse(source.encode("utf-8"))
+    return [node for node in tree.root_node.children if node.type == "class_declaration"]
+
+
+class TestComputeAstHash:
+    """Test node-based AST hashing without a language server."""
+
+    def setup_method(self):
+        self.analyzer = JavaCodeAnalyzer(use_lsp=False)
+
+    def test_ignores_comments_and_modifiers(self):
+        plain, commented = _class_nodes(
+            self.analyzer,
+            "class A { int f() { return 1; } }\n"
+            "class A { /* note */ public final int f() { return 1; } // trailing\n }"
+        )
+
+        assert self.analyzer.compute_ast_hash(plain) == self.analyzer.compute_ast_hash(commented)
+
+    def test_structure_change_changes_hash(self):
+        first, second = _class_nodes(
+            self.analyzer,
+            "class A { int f() { return 1; } }\n"
+            "class A { int f() { return g(); } }"
+        )
+
+        assert self.analyzer.compute_ast_hash(first) != self.analyzer.compute_ast_hash(second)
+
+    def test_repeated_source_is_memoized(self):
+        first, second = _class_nodes(self.analyzer, "class A { }\nclass A { }")
+
+        assert self.analyzer.compute_ast_hash(first) == self.analyzer.compute_ast_hash(second)
+        assert len(self.analyzer._ast_hash_memo) == 1
+        # Keyed by a digest, so the memo doesn't keep the source text alive
+        assert not any(isinstance(part, bytes) for key in self.analyzer._ast_hash_memo for part in key)
+
+
+class TestExtractCode:
+    """Test comment removal from node source."""
+
+    def setup_method(self):
+        self.analyzer = JavaCodeAnalyzer(use_lsp=False)
+
+    def test_splices_out_comments_only(self):
+        source = (
+            'class A {\n'
+            '    String url = "http://example.com"; // trailing\n'
+            '    int f(/* unused */ int n) { /* block */ return n; }\n'
+            '}'
+        )
+        class_node, = _class_nodes(self.analyzer, source)
+
+        code = self.analyzer._extract_code(class_node, source)
+
+        assert code == (
+            'class A {\n'
+            '    String url = "http://example.com";  \n'
+            '    int f(  int n) {   return n; }\n'
+            '}'
+        )
+
+    def test_comment_between_tokens_keeps_them_apart(self):
+        source = "class A { int/*x*/f(final/*c*/String a, List<String>/*x*/b) { return 0; } }"
+        class_node, = _class_nodes(self.analyzer, source)
+        method_node = class_node.child_by_field_name("body").named_children[0]
+
+        assert self.analyzer._extract_method_name(method_node, source)[0] == "f(final String a, List<String> b)"
+        assert self.analyzer._extract_code(method_node, source).startswith("int f(final String a")
+
+    def test_method_name_ignores_parameter_comments(self):
+        source = "class A { int f(/* unused */ int n) { return n; } }"
+        class_node, = _class_nodes(self.analyzer, source)
+        method_node = class_node.child_by_field_name("body").named_children[0]
+
+        name, _ = self.analyzer._extract_method_name(method_node, source)
+
+        assert name == "f(int n)"
+
+    def test_members_reuse_the_class_comment_scan(self):
+        source = (
+            "class A {\n"
+            "    /** doc */ int f(int n) { /* a */ return n; } // between\n"
+            "    void g() { // b\n    }\n"
+            "    class B { void h() { /* c */ } }\n"
+            "}"
+        )
+        class_node, = _class_nodes(self.analyzer, source)
+        members = class_node.child_by_field_name("body").named_children
+        expected = [self.analyzer._extract_code(member, source) for member in members]
+
+        comments = self.analyzer._comments_in(class_node, self.analyzer._get_comment_query())
+        self.analyzer._comment_scope = (class_node, [c.start_byte for c in comments], comments)
+        self.analyzer._query_captures = None  # any fresh query would now fail
+
+        assert [self.analyzer._extract_code(member, source) for member in members] == expected
+
+
+class TestClassCache:
+    """Test class contexts built by the tree-sitter-only cache pass."""
+
+    def test_parent_class_is_full_name_or_none(self, tmp_path):
+        path = tmp_path / "App.java"
+        path.write_text("package com.example;\nclass App { static class Inner { } }\n", encoding="utf-8")
+
+        contexts = JavaCodeAnalyzer(use_lsp=False).process_class_cache_file(path)
+
+        assert contexts["com.example.App"].parent_class is None
+        assert contexts["com.example.App.Inner"].parent_class == "com.example.App"
+        assert contexts["com.example.App.Inner"].is_nested
+
+    def test_deeply_nested_and_local_classes(self, tmp_path):
+        path = tmp_path / "App.java"
+        path.write_text(
+            "class App { interface A { enum B { X; } } void run() { class Local { class Deep { } } } }\n",
+            encoding="utf-8"
+        )
+        analyzer = JavaCodeAnalyzer(use_lsp=False)
+
+        contexts = analyzer.process_class_cache_file(path)
+
+        assert sorted(contexts) == ["App", "App.A", "App.A.B", "App.Local", "App.Local.Deep"]
+        assert contexts["App.A.B"].parent_class == "App.A"
+        assert contexts["App.Local.Deep"].parent_class == "App.Local"
+        assert analyzer._enclosing_names == {}
+
+
+class TestFilterFilesByTargets:
+    """Test target-file filtering used for partial parses."""
+
+    def test_matches_path_suffixes_with_either_separator(self):
+        files = [Path("/repo/src/com/a/App.java"), Path("/repo/src/com/b/App.java"), Path("/repo/src/Util.java")]
+
+        filtered = JavaCodeAnalyzer(use_lsp=False)._filter_files_by_targets(files, ["com\\a\\App.java", "Util.java"])
+
+        assert filtered == [files[0], files[2]]
+
+
+class TestQueryMethodDependencies:
+    """Test the fused per-method query against its individual parts."""
+
+    def test_matches_separate_queries(self):
+        from tree_sitter import Query, QueryCursor
+        from source_atlas.analyzers import java_analyzer
+
+        analyzer = JavaCodeAnalyzer(use_lsp=False)
+        class_node, = _class_nodes(
+            analyzer,
+            "class A { java.util.List<String> f(a.b.C x) { Map<K, V> m = foo.bar(1); this.x.y = z.w; return g(m); } }"
+        )
+        method_node = class_node.child_by_field_name("body").named_children[0]
+
+        def positions(captures):
+            return {name: sorted((node.start_byte, node.end_byte) for node in nodes) for name, nodes in captures.items()}
+
+        call_matches, *fused = analyzer._query_method_dependencies(method_node)
+        separate = [
+            QueryCursor(Query(analyzer.language, source)).captures(method_node)
+            for source in (java_analyzer._USED_TYPE_QUERY, java_analyzer._FIELD_ACCESS_QUERY)
+        ]
+
+        assert [positions(c) for c in fused] == [positions(c) for c in separate]
+        assert sorted(node.text for node in fused[1]["field_name"]) == [b"w", b"x", b"y"]
+        assert [{name: node.text for name, node in match.items()} for match in call_matches] == [
+            {"call": b"foo.bar(1)", "object": b"foo", "method_name": b"bar", "arguments": b"(1)"},
+            {"call": b"g(m)", "method_name": b"g", "arguments": b"(m)"},
+        ]
+
+    def test_calls_without_object_keep_their_own_object(self):
+        analyzer = JavaCodeAnalyzer(use_lsp=False)
+        class_node, = _class_nodes(analyzer, "class A { void f() { first(); b.second(); third(); } }")
+        method_node = class_node.child_by_field_name("body").named_children[0]
+
+        call_matches = analyzer._query_method_dependencies(method_node)[0]
+
+        assert [(match["method_name"].text, match.get("object")) for match in call_matches][0] == (b"first", None)
+        assert call_matches[1]["object"].text == b"b"
+        assert "object" not in call_matches[2]
+
+
+class TestLspMemoization:
+    """Test that repeated LSP lookups at one position hit the server once."""
+
+    class _CountingLsp:
+        def __init__(self):
+            self.calls = []
+
+        def request_definition(self, file_path, line, col):
+            self.calls.append((file_path, line, col))
+            return [{"uri": f"file:///{file_path}"}]
+
+        def batch_request_definition(self, file_path, positions):
+            self.calls.append((file_path, list(positions)))
+            return [[{"name": f"save@{line}:{col}"}] for line, col in positions]
+
+        def batch_request_hover(self, file_path, positions):
+            self.calls.append((file_path, list(positions)))
+            return [{"contents": {"value": f"field@{line}:{col}"}} for line, col in positions]
+
+    def test_same_position_is_requested_once_until_cleared(self):
+        analyzer = JavaCodeAnalyzer(use_lsp=False)
+        analyzer.lsp_service = lsp = self._CountingLsp()
+
+        first = analyzer._request_definition("App.java", 3, 7)
+        assert analyzer._request_definition("App.java", 3, 7) == first
+        analyzer._request_definition("App.java", 4, 7)
+        assert len(lsp.calls) == 2
+
+        analyzer.clear_lsp_cache()
+        analyzer._request_definition("App.java", 3, 7)
+        assert len(lsp.calls) == 3
+
+    def test_failed_positions_are_asked_again(self):
+        analyzer = JavaCodeAnalyzer(use_lsp=False)
+        analyzer.lsp_service = lsp = self._CountingLsp()
+        answers = lsp.batch_request_definition
+        lsp.batch_request_definition = lambda file_path, positions: (
+            [RuntimeError("ContentModified")] + answers(file_path, positions)[1:])
+
+        assert analyzer._request_definitions("A.java", [(0, 1), (0, 2)]) == [None, [{"name": "save@0:2"}]]
+        lsp.batch_request_definition = answers
+
+        assert analyzer._request_definitions("A.java", [(0, 1), (0, 2)]) == [
+            [{"name": "save@0:1"}], [{"name": "save@0:2"}]]
+        assert lsp.calls[-1] == ("A.java", [(0, 1)])
+
+    def test_failed_hovers_are_asked_again(self):
+        analyzer = JavaCodeAnalyzer(use_lsp=False)
+        analyzer.lsp_service = lsp = self._CountingLsp()
+        answers = lsp.batch_request_hover
+        lsp.batch_request_hover = lambda file_path, positions: [RuntimeError("RequestCancelled")] * len(positions)
+
+        assert analyzer._request_hovers("A.java", [(0, 1)]) == [None]
+        lsp.batch_request_hover = answers
+
+        assert analyzer._request_hovers("A.java", [(0, 1)]) == [{"contents": {"value": "field@0:1"}}]
+
+    def test_edited_file_drops_memoized_answers(self):
+        analyzer = JavaCodeAnalyzer(use_lsp=False)
+        analyzer.lsp_service = lsp = self._CountingLsp()
+        analyzer.reparse_file("A.java", b"class A { }")
+        analyzer._request_definition("B.java", 3, 7)
+
+        analyzer.reparse_file("A.java", b"class A { }")
+        analyzer._request_definition("B.java", 3, 7)
+        assert len(lsp.calls) == 1
+
+        analyzer.reparse_file("A.java", b"class A { int a; }")
+        analyzer._request_definition("B.java", 3, 7)
+        assert len(lsp.calls) == 2
+
+    def test_method_calls_resolve_in_one_batch(self):
+        analyzer = JavaCodeAnalyzer(use_lsp=False)
+        analyzer.lsp_service = lsp = self._CountingLsp()
+        analyzer.methods_cache = {"save"}
+        analyzer._build_full_method_name_from_lsp = lambda result: result["name"]
+        class_node, = _class_nodes(analyzer, "class A { void run() { a.save(); skip(); b.save(); } }")
+        method_node = class_node.child_by_field_name("body").named_children[0]
+        captures = analyzer._query_method_dependencies(method_node)[0]
+        source = method_node.text.decode("utf-8")
+
+        calls = analyzer._extract_method_calls(captures, "A.java", source)
+        assert [call.name for call in calls] == ["save@0:25", "save@0:43"]
+        assert lsp.calls == [("A.java", [(0, 25), (0, 43)])]
+
+        analyzer._extract_method_calls(captures, "A.java", source)
+        assert len(lsp.calls) == 1
+
+    def test_class_methods_share_one_batch(self):
+        analyzer = JavaCodeAnalyzer(use_lsp=False)
+        analyzer.lsp_service = lsp = self._CountingLsp()
+        analyzer.methods_cache = {"save"}
+        analyzer._build_full_method_name_from_lsp = lambda result: result["name"]
+        source = "class A { void a() { x.save(); } void b() { y.save(); } }"
+        class_node, = _class_nodes(analyzer, source)
+
+        methods = analyzer._extract_class_methods(class_node, source, [], "A", "A.java", {}, "A")
+
+        assert [[call.name for call in method.method_calls] for method in methods] == [["save@0:23"], ["save@0:46"]]
+        assert lsp.calls == [("A.java", [(0, 23), (0, 46)])]
+
+    def test_field_accesses_resolve_in_one_batch(self):
+        analyzer = JavaCodeAnalyzer(use_lsp=False)
+        analyzer.lsp_service = lsp = self._CountingLsp()
+        class_node, = _class_nodes(analyzer, "class A { void run() { this.a = b.c; } }")
+        method_node = class_node.child_by_field_name("body").named_children[0]
+        field_captures = analyzer._query_method_dependencies(method_node)[2]
+
+        assert sorted(analyzer._extract_field_access(field_captures, "A.java")) == ["field@0:29", "field@0:35"]
+        assert lsp.calls == [("A.java", [(0, 29), (0, 35)])]
+
+
+class TestFileCaches:
+    """Test the per-path file content and line caches."""
+
+    def test_lombok_position_reads_cached_lines(self, tmp_path):
+        path = tmp_path / "User.java"
+        path.write_text("class User {\n    @Getter\n    private String name;\n}\n", encoding="utf-8")
+        analyzer = JavaCodeAnalyzer(use_lsp=False)
+
+        assert analyzer._is_lombok_generated_position(1, str(path))
+        assert not analyzer._is_lombok_generated_position(2, str(path))
+        assert not analyzer._is_lombok_generated_position(99, str(path))
+        assert analyzer._file_cache.reads == 1
+
+    def test_text_is_decoded_from_the_cached_bytes(self, tmp_path):
+        path = tmp_path / "Caf\u00e9.java"
+        path.write_bytes("class Caf\u00e9 { }".encode("utf-8"))
+        analyzer = JavaCodeAnalyzer(use_lsp=False)
+
+        assert analyzer._get_file_tree(str(path)).root_node.type == "program"
+        assert analyzer._read_file_content(str(path)) == "class Caf\u00e9 { }"
+        assert analyzer._file_cache.reads == 1
+
+    def test_least_recently_used_files_are_dropped_over_the_size_cap(self, tmp_path):
+        paths = []
+        for name in ("A", "B", "C"):
+            path = tmp_path / f"{name}.java"
+            path.write_bytes(b"x" * 10)
+            paths.append(str(path))
+        cache = _FileCache(max_bytes=25)
+
+        cache.read_bytes(paths[0])
+        cache.read_bytes(paths[1])
+        cache.read_bytes(paths[0])
+        cache.read_bytes(paths[2])
+
+        assert cache.total_bytes == 20
+        assert list(cache._entries) == [paths[0], paths[2]]
+        assert cache.read_lines(paths[2]) == ("x" * 10,)
+        # Text and lines of C are charged too, which leaves room for C alone
+        assert list(cache._entries) == [paths[2]]
+
+
+    def test_parsed_sources_are_bounded_by_size(self, monkeypatch):
+        monkeypatch.setattr(base_analyzer, "_TREE_CACHE_MAX_BYTES", 50)
+        analyzer = JavaCodeAnalyzer(use_lsp=False)
+
+        analyzer.reparse_file("A.java", b"class A { }")
+        analyzer.reparse_file("B.java", b"class B { }")
+        analyzer.reparse_file("A.java", b"class A { }")
+        analyzer.reparse_file("C.java", b"class C { }")
+
+        # Each entry holds 11 bytes of source twice (bytes and str); B was least recently used
+        assert list(analyzer._tree_cache) == ["A.java", "C.java"]
+        assert analyzer._tree_cache_bytes == 44
+
+
+class TestParseSource:
+    """Test when an incremental reparse falls back to a full parse."""
+
+    class _CountingParser:
+        def __init__(self, parser):
+            self.parser = parser
+            self.calls = 0
+
+        def parse(self, *args):
+            self.calls += 1
+            return self.parser.parse(*args)
+
+    def _analyzer(self):
+        analyzer = JavaCodeAnalyzer(use_lsp=False)
+        analyzer.parser = self._CountingParser(analyzer.parser)
+        return analyzer
+
+    def test_file_that_already_had_errors_is_parsed_once(self):
+        analyzer = self._analyzer()
+        analyzer.reparse_file("A.java", b"class A { void a( }")
+
+        tree, _ = analyzer.reparse_file("A.java", b"class A { int b; void a( }")
+
+        assert tree.root_node.has_error
+        assert analyzer.parser.calls == 2
+
+    def test_edit_that_introduces_errors_is_parsed_in_full(self):
+        analyzer = self._analyzer()
+        analyzer.reparse_file("A.java", b"class A { void a() { } }")
+
+        tree, _ = analyzer.reparse_file("A.java", b"class A { void a( { } }")
+
+        assert tree.root_node.has_error
+        assert analyzer.parser.calls == 3
+
+class TestAnnotationMatching:
+    """Test the precompiled annotation matchers."""
+
+    def test_config_annotations(self):
+        analyzer = JavaCodeAnalyzer(use_lsp=False)
+        config, plain = _class_nodes(
+            analyzer,
+            "@Configuration(proxyBeanMethods = false)\nclass A { }\n@Deprecated\nclass B { }"
+        )
+
+        assert analyzer._has_config_annotations(config, "")
+        assert not analyzer._has_config_annotations(plain, "")
+
+
+class TestFieldLookups:
+    """Test name/parameters/body lookups through tree-sitter fields."""
+
+    def test_method_signature_and_body(self):
+        analyzer = JavaCodeAnalyzer(use_lsp=False)
+        class_node, = _class_nodes(
+            analyzer,
+            "abstract class A { <T> java.util.List<T> g(final int a, String... b) throws Exception { return null; }\n"
+            "abstract void h(); A() { } }"
+        )
+        generic, abstract, constructor = analyzer._get_class_body(class_node).named_children
+
+        assert analyzer._extract_method_name(generic, "")[0] == "g(final int a, String... b)"
+        assert analyzer._extract_method_name(abstract, "")[0] == "h()"
+        assert not analyzer._is_abstract_or_interface_method(generic)
+        assert analyzer._is_abstract_or_interface_method(abstract)
+        assert not analyzer._is_abstract_or_interface_method(constructor)
+
+    def test_abstract_modifier(self):
+        analyzer = JavaCodeAnalyzer(use_lsp=False)
+        abstract, annotated, plain = _class_nodes(
+            analyzer, "abstract class A { }\n@Deprecated public abstract class B { }\nclass C { }")
+
+        assert analyzer._should_check_implements(abstract, "")
+        assert analyzer._should_check_implements(annotated, "")
+        assert not analyzer._should_check_implements(plain, "")
+
+    def test_abstract_in_a_comment_is_not_a_modifier(self):
+        analyzer = JavaCodeAnalyzer(use_lsp=False)
+        class_node, = _class_nodes(analyzer, "public /* not abstract */ final class X { }")
+
+        assert not analyzer._should_check_implements(class_node, "")
+
+
+class _NullLsp:
+    """Language server stand-in that resolves nothing."""
+
+    @contextlib.contextmanager
+    def start_server(self):
+        yield self
+
+    @contextlib.contextmanager
+    def open_file(self, file_path):
+        yield
+
+    def request_definition(self, file_path, line, col):
+        return []
+
+    def batch_request_definition(self, file_path, positions):
+        return [[] for _ in positions]
+
+    def batch_request_hover(self, file_path, positions):
+        return [None for _ in positions]
+
+    def request_implementation(self, file_path, line, col):
+        return []
+
+    def request_hover(self, file_path, line, col):
+        return None
+
+
+class _NullLspAnalyzer(JavaCodeAnalyzer):
+    def __init__(self, root_path=None, project_id=None, branch=None):
+        super().__init__(root_path, project_id, branch, use_lsp=False)
+        self.lsp_service = _NullLsp()
+
+    def _get_analysis_worker_args(self):
+        return type(self), (self._root_path, self.project_id, self.branch), {}
+
+
+class TestParallelAnalysis:
+    """Test that worker processes produce the same chunks as the serial pass."""
+
+    def test_matches_serial(self, tmp_path):
+        for name in ("A", "B", "C"):
+            (tmp_path / f"{name}.java").write_text(
+                f"package p;\nclass {name} {{ int f(int x) {{ return x; }} static class In{name} {{ }} }}\n",
+                encoding="utf-8"
+            )
+        analyzer = _NullLspAnalyzer(str(tmp_path), "1", "main")
+
+        with analyzer:
+            serial = analyzer.parse_project(tmp_path, export_output=False)
+            parallel = analyzer.parse_project(tmp_path, export_output=False, analysis_workers=2)
+
+        assert len(serial) == 6
+        assert parallel == serial
+
+
+class TestFilterBuiltinItems:
+    """Test builtin filtering of resolved names."""
+
+    def test_drops_builtins_and_duplicates_and_interns_names(self):
+        analyzer = JavaCodeAnalyzer(use_lsp=False)
+        name = "".join(["com.example.", "Order"])
+
+        filtered = analyzer.filter_builtin_items(["int", "java.util.List", name, "com.example.Order"])
+
+        assert filtered == ["com.example.Order"]
+        assert filtered[0] is sys.intern("com.example.Order")
+
+
+class TestResolveClassFromHover:
+    """Test class extraction from method hover signatures."""
+
+    def test_signatures(self):
+        analyzer = JavaCodeAnalyzer(use_lsp=False)
+
+        assert analyzer._resolve_class_from_hover(" void com.example.App.run(String[] args)") == "com.example.App"
+        assert analyzer._resolve_class_from_hover(
+            "@Override java.util.List<String>[] com.example.Repo.find(int id)") == "com.example.Repo"
+        assert analyzer._resolve_class_from_hover("com.example.App") is None
+
+
+class TestResolveClassPathWithHover:
+    """Test picking the declaring class of a definition out of its hover signature."""
+
+    class _HoverLsp:
+        def __init__(self, contents):
+            self.contents = contents
+            self.calls = []
+
+        def request_hover(self, file_path, line, col):
+            self.calls.append((file_path, line, col))
+            return {"contents": self.contents}
+
+    def test_hover_signature(self):
+        analyzer = JavaCodeAnalyzer(use_lsp=False)
+        analyzer.lsp_service = lsp = self._HoverLsp({"value": "void com.example.Outer.Inner.run()"})
+        result = {"range": {"start": {"line": 3, "character": 9}}}
+
+        assert analyzer._resolve_class_path_with_hover(result, "Outer.java") == "com.example.Outer.Inner"
+        assert lsp.calls == [("Outer.java", 3, 9)]
+
+    def test_unusable_location_or_hover(self):
+        analyzer = JavaCodeAnalyzer(use_lsp=False)
+        analyzer.lsp_service = lsp = self._HoverLsp("void com.example.Outer.run()")
+
+        assert analyzer._resolve_class_path_with_hover({}, "Outer.java") is None
+        assert lsp.calls == []
+        assert analyzer._resolve_class_path_with_hover({"range": {"start": {"line": 3, "character": 9}}},
+                                                       "Outer.java") is None
+
+
+class TestFileTrees:
+    """Test tree reuse for files that LSP answers point into."""
+
+    def test_parses_each_file_once_and_reuses_analyzed_trees(self, tmp_path):
+        analyzed, target = tmp_path / "A.java", tmp_path / "B.java"
+        analyzed.write_text("class A { void a() { } }", encoding="utf-8")
+        target.write_text("class B { void b() { } }", encoding="utf-8")
+        analyzer = JavaCodeAnalyzer(use_lsp=False)
+        analyzed_tree, _ = analyzer.reparse_file(str(analyzed), analyzed.read_bytes())
+
+        assert analyzer._get_file_tree(str(analyzed)) is analyzed_tree
+        assert analyzer._get_file_tree(str(target)) is analyzer._get_file_tree(str(target))
+        assert list(analyzer._target_trees) == [str(target)]
+        assert analyzer._find_method_from_file(str(target), 0, 15).child_by_field_name("name").text == b"b"
+
+    def test_edited_file_is_reparsed_against_its_previous_tree(self, tmp_path):
+        target = tmp_path / "B.java"
+        target.write_text("class B { void b() { } }", encoding="utf-8")
+        analyzer = JavaCodeAnalyzer(use_lsp=False)
+        analyzer._get_file_tree(str(target))
+
+        target.write_text("class B { void c() { } void b() { } }", encoding="utf-8")
+        analyzer._clear_file_caches()
+
+        assert analyzer._find_method_from_file(str(target), 0, 28).child_by_field_name("name").text == b"b"
+        assert analyzer._target_trees[str(target)][2] == target.read_bytes()
+
+
+class TestFindMethodAtPosition:
+    """Test locating the method whose name sits at an LSP position."""
+
+    SOURCE = (
+        "class A {\n"
+        "    void outer() {\n"
+        "        new Runnable() { public void run() { } };\n"
+        "    }\n"
+        "}\n"
+    )
+
+    def _find(self, line, character):
+        analyzer = JavaCodeAnalyzer(use_lsp=False)
+        tree = analyzer.parser.parse(self.SOURCE.encode("utf-8"))
+        method = analyzer._find_method_at_position(tree.root_node, line, character)
+        return method.child_by_field_name("name").text if method is not None else None
+
+    def test_name_start_and_end(self):
+        assert self._find(1, 9) == b"outer"
+        assert self._find(1, 14) == b"outer"
+
+    def test_method_nested_in_another_body(self):
+        assert self._find(2, 37) == b"run"
+
+    def test_position_outside_a_method_name(self):
+        assert self._find(1, 18) is None
+        assert self._find(0, 6) is None
+
+
+class TestExtractAllClassNodes:
+    """Test collecting every type declaration of a file."""
+
+    def test_all_kinds_in_one_list(self):
+        analyzer = JavaCodeAnalyzer(use_lsp=False)
+        tree = analyzer.parser.parse(
+            b"interface I { } class A { enum E { X } @interface N { } } record R(int x) { }")
+
+        nodes = analyzer._extract_all_class_nodes(tree.root_node)
+
+        assert [node.child_by_field_name("name").text for node in nodes] == [b"I", b"A", b"E", b"N", b"R"]
+
+    def test_super_types(self):
+        analyzer = JavaCodeAnalyzer(use_lsp=False)
+        class_node, = _class_nodes(analyzer, "class A extends B implements Comparable<A>, java.io.Closeable { }")
+
+        assert sorted(analyzer._extract_implements_extends(class_node, "")) == ["B", "Closeable", "Comparable"]
+
+
+class TestBuildImportMapping:
+    """Test mapping imported simple names to qualified names."""
+
+    def test_top_level_imports(self):
+        analyzer = JavaCodeAnalyzer(use_lsp=False)
+        source = ("package p;\nimport java.util.List;\nimport static java.util.Map.entry;\nimport java.io.*;\n"
+                  "class A { List<String> names; }")
+        tree = analyzer.parser.parse(source.encode("utf-8"))
+
+        mapping = analyzer.build_import_mapping(tree.root_node, source)
+
+        assert mapping == {"List": "java.util.List", "entry": "java.util.Map.entry", "io": "java.io"}
+
+
+class TestIsNestedClass:
+    """Test the kind-id check on the enclosing declarations of a class."""
+
+    def test_nested_in_every_declaration_kind(self):
+        analyzer = JavaCodeAnalyzer(use_lsp=False)
+        tree = analyzer.parser.parse(
+            b"class A { class B { } } interface I { class C { } } enum E { X; class D { } } "
+            b"record R(int x) { class F { } } @interface N { class G { } }")
+
+        nested = {node.child_by_field_name("name").text: analyzer._is_nested_class(node, tree.root_node)
+                  for node in analyzer._extract_all_class_nodes(tree.root_node)}
+
+        assert sorted(name for name, is_nested in nested.items() if is_nested) == [b"B", b"C", b"D", b"F", b"G"]
+        assert len(analyzer._class_kind_ids) == 5
+
+
+class TestHasMultipleClasses:
+    """Test detecting files that declare more than one type."""
+
+    def _check(self, tmp_path, source):
+        path = tmp_path / "A.java"
+        path.write_text(source, encoding="utf-8")
+        return JavaCodeAnalyzer(use_lsp=False)._has_multiple_classes(str(path))
+
+    def test_single_class(self, tmp_path):
+        assert not self._check(tmp_path, "package p;\n@Deprecated\nclass A { void a() { new Object() { }; } }")
+
+    def test_two_top_level_types(self, tmp_path):
+        assert self._check(tmp_path, "class A { }\ninterface B { }")
+
+    def test_nested_and_local_types(self, tmp_path):
+        assert self._check(tmp_path, "class A { enum E { X } }")
+        assert self._check(tmp_path, "class A { void a() { record R(int x) { } } }")
+
+
+class TestExtractFieldFromHover:
+    """Test reading the field signature out of the hover contents shapes LSP allows."""
+
+    def test_contents_shapes(self):
+        extract = JavaCodeAnalyzer(use_lsp=False)._extract_field_from_hover
+
+        assert extract({"contents": {"kind": "markdown", "value": "int a"}}) == "int a"
+        assert extract({"contents": [{"language": "java", "value": "int b"}, "docs"]}) == "int b"
+        assert extract({"contents": ["int c"]}) == "int c"
+        assert extract({"contents": "int d"}) == "int d"
+
+    def test_missing_contents(self):
+        extract = JavaCodeAnalyzer(use_lsp=False)._extract_field_from_hover
+
+        assert extract(None) is None
+        assert extract({}) is None
+        assert extract({"contents": []}) is None
+        assert extract({"contents": None}) is None
+
+
+class TestExtractFileInfoFromLsp:
+    """Test reading the target file and position out of an LSP location."""
+
+    def test_absolute_path_and_uri_fallback(self, tmp_path):
+        path = tmp_path / "src" / "A.java"
+        analyzer = JavaCodeAnalyzer(str(tmp_path), use_lsp=False)
+        location = {"range": {"start": {"line": 3, "character": 7}}}
+
+        assert analyzer._extract_file_info_from_lsp({"absolutePath": str(path), **location}) == (str(path), 3, 7)
+        assert analyzer._extract_file_info_from_lsp({"uri": path.as_uri(), **location}) == (str(path), 3, 7)
+
+    def test_relative_paths_are_resolved_once(self, tmp_path):
+        path = tmp_path / "src" / "main" / "java" / "com" / "A.java"
+        analyzer = JavaCodeAnalyzer(str(tmp_path), use_lsp=False)
+
+        assert analyzer._convert_absolute_to_relative_package_path(str(path)) == "com.A"
+        analyzer._relative_paths[str(path)] = "src/main/java/com/B.java"
+        assert analyzer._convert_absolute_to_relative_package_path(str(path)) == "com.B"
+
+    def test_locations_outside_the_project(self, tmp_path):
+        analyzer = JavaCodeAnalyzer(str(tmp_path / "project"), use_lsp=False)
+        location = {"range": {"start": {"line": 3, "character": 7}}}
+
+        assert analyzer._extract_file_info_from_lsp({"absolutePath": str(tmp_path / "A.java"), **location}) is None
+        assert analyzer._extract_file_info_from_lsp(location) is None
+
+
+class TestAdjustQualifiedNameForType:
+    """Test fitting an LSP qualified name to the type name written in the source."""
+
+    def test_adjustments(self):
+        adjust = JavaCodeAnalyzer(use_lsp=False)._adjust_qualified_name_for_type
+
+        assert adjust("com.example.User", "User") == "com.example.User"
+        assert adjust("com.example.Outer", "Outer.Inner") == "com.example.Outer.Inner"
+        assert adjust("com.example.Outer", "Inner") == "com.example.Outer.Inner"
+
+    def test_left_alone(self):
+        adjust = JavaCodeAnalyzer(use_lsp=False)._adjust_qualified_name_for_type
+
+        assert adjust("com.example.User", "var") == "com.example.User"
+        assert adjust("com.example.User", None) == "com.example.User"
+        assert adjust("User", "Other") == "User"
+
+
+class TestMissingMethodDiagnostics:
+    """Test that the Lombok diagnostic for unmatched positions stays off the default path."""
+
+    def test_lombok_check_only_runs_for_debug_logs(self, tmp_path):
+        path = tmp_path / "User.java"
+        path.write_text("class User {\n    @Getter\n    private String name;\n}\n", encoding="utf-8")
+        analyzer = JavaCodeAnalyzer(use_lsp=False)
+        checked = []
+        analyzer._is_lombok_generated_position = lambda line, file_path: checked.append(line) or True
+
+        logger.disable("source_atlas")
+        try:
+            assert analyzer._find_method_from_file(str(path), 1, 4) is None
+        finally:
+            logger.enable("source_atlas")
+        assert checked == []
+
+        assert analyzer._find_method_from_file(str(path), 1, 4) is None
+        assert checked == [1]
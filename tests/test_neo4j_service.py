@@ -0,0 +1,155 @@
+"""
+Unit tests for query generation and execution in Neo4jService, without a database.
+"""
+import sys
+from pathlib import Path
+
+import pytest
+from neo4j.exceptions import ClientError, ServiceUnavailable, SessionExpired, TransientError
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from source_atlas.models.domain_models import CodeChunk, ChunkType
+from source_atlas.neo4jdb import neo4j_service
+from source_atlas.neo4jdb.neo4j_service import Neo4jService
+
+
+class _Session:
+    """Session stand-in: queries containing FAIL are invalid, others first raise the queued errors."""
+
+    def __init__(self, errors=(), runs=None):
+        self.errors = list(errors)
+        self.runs = [] if runs is None else runs
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def run(self, query, params=None):
+        self.runs.append(query)
+        if "FAIL" in query:
+            raise ClientError("invalid query")
+        if self.errors:
+            raise self.errors.pop(0)
+        return self
+
+    def consume(self):
+        pass
+
+
+class _Db:
+    """Database stand-in; every session appends to one shared run log unless a session is given."""
+
+    def __init__(self, session=None):
+        self.driver = self
+        self._session = session
+        self.runs = []
+
+    def session(self):
+        return self._session or _Session(runs=self.runs)
+
+
+def _chunk(class_name, used_types=()):
+    return CodeChunk(
+        package="com.example",
+        class_name=class_name,
+        full_class_name=f"com.example.{class_name}",
+        file_path=f"src/{class_name}.java",
+        content=f"class {class_name} {{ String arrow = \"a-[b]->c\"; }}",
+        ast_hash=f"hash_{class_name}",
+        implements=(),
+        methods=(),
+        parent_class=None,
+        project_id="1",
+        branch="main",
+        used_types=used_types,
+        type=ChunkType.REGULAR,
+    )
+
+
+class TestGenerateCypherFromChunks:
+    """Test that node and relationship queries come back separately."""
+
+    def test_node_and_relationship_queries_are_separate_lists(self):
+        service = Neo4jService(db=_Db(_Session([])))
+
+        node_queries, relationship_queries = service.generate_cypher_from_chunks(
+            [_chunk("A", used_types=("com.example.B",)), _chunk("B")])
+
+        assert node_queries and relationship_queries
+        assert all("DELETE" in query or "create.node" in query for query, _ in node_queries)
+        assert all("MERGE (source)-[" in query for query, _ in relationship_queries)
+
+
+class TestExecuteQueriesBatch:
+    """Test that only transient errors are retried."""
+
+    @pytest.fixture(autouse=True)
+    def no_backoff(self, monkeypatch):
+        monkeypatch.setattr(neo4j_service, "_RETRY_BASE_DELAY_SECONDS", 0)
+
+    def test_transient_errors_are_retried(self):
+        session = _Session([TransientError("deadlock"), TransientError("deadlock")])
+
+        Neo4jService(db=_Db(session)).execute_queries_batch([("RETURN 1", {})])
+
+        assert len(session.runs) == 3
+
+    def test_retries_are_bounded(self):
+        session = _Session([TransientError("deadlock")] * 3)
+
+        with pytest.raises(TransientError):
+            Neo4jService(db=_Db(session)).execute_queries_batch([("RETURN 1", {})], max_retries=3)
+
+        assert len(session.runs) == 3
+
+    def test_dropped_connections_are_retried(self):
+        session = _Session([ServiceUnavailable("connection refused"), SessionExpired("connection lost")])
+
+        Neo4jService(db=_Db(session)).execute_queries_batch([("RETURN 1", {})])
+
+        assert len(session.runs) == 3
+
+    def test_other_errors_surface_immediately(self):
+        session = _Session([ClientError("syntax error")])
+
+        with pytest.raises(ClientError):
+            Neo4jService(db=_Db(session)).execute_queries_batch([("RETURN 1", {}), ("RETURN 2", {})])
+
+        assert session.runs == ["RETURN 1"]
+
+
+class TestImportCodeChunksSimple:
+    """Test the sharded import over concurrent sessions."""
+
+    def _import(self, db, chunks, **kwargs):
+        Neo4jService(db=db).import_code_chunks_simple(chunks, max_workers=2, **kwargs)
+        return [query for query in db.runs if not query.startswith("CREATE INDEX")]
+
+    def test_tombstones_come_from_the_first_shard_only(self):
+        deleted = [{"name": "Gone", "class_name": "com.example.Gone", "project_id": "1", "branch": "main"}]
+
+        runs = self._import(_Db(), [_chunk("A"), _chunk("B")], deleted_nodes=deleted)
+
+        assert sum("$tombstones" in query for query in runs) == 1
+
+    def test_node_queries_finish_before_relationship_queries(self):
+        chunks = [_chunk("A", used_types=("com.example.D",)), _chunk("B", used_types=("com.example.A",)),
+                  _chunk("C", used_types=("com.example.B",)), _chunk("D")]
+
+        runs = self._import(_Db(), chunks)
+
+        relationship_runs = [i for i, query in enumerate(runs) if "MERGE (source)-[" in query]
+        node_runs = [i for i, query in enumerate(runs) if "MERGE (source)-[" not in query]
+        assert relationship_runs and node_runs
+        assert max(node_runs) < min(relationship_runs)
+
+    def test_failing_shard_raises(self):
+        service = Neo4jService(db=_Db())
+
+        with pytest.raises(ClientError):
+            service.execute_queries_concurrently([[("RETURN 1", {})], [("FAIL", {})]], max_workers=2)
@@ -0,0 +1,54 @@
+"""
+Unit tests for source_atlas.utils.tree_sitter_helper.
+"""
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from tree_sitter import Parser
+from tree_sitter_language_pack import get_language
+
+from source_atlas.utils.tree_sitter_helper import compute_edit, extract_content
+
+
+class TestExtractContent:
+    """Test node text extraction against byte offsets."""
+
+    def test_non_ascii_source(self):
+        content = 'class A { String s = "h\u00e9llo \u2603"; int x; }'
+        tree = Parser(get_language("java")).parse(content.encode("utf-8"))
+        body = tree.root_node.children[0].child_by_field_name("body")
+        fields = [child for child in body.children if child.type == "field_declaration"]
+
+        assert [extract_content(node, content) for node in fields] == [
+            'String s = "h\u00e9llo \u2603";', "int x;"
+        ]
+
+
+class TestComputeEdit:
+    """Test the single-range edit used for incremental re-parsing."""
+
+    def test_insertion_inside_line(self):
+        old = b"class A {\n  int x;\n}\n"
+        new = b"class A {\n  int xy;\n}\n"
+
+        edit = compute_edit(old, new)
+
+        assert edit["start_byte"] == 17
+        assert edit["old_end_byte"] == 17
+        assert edit["new_end_byte"] == 18
+        assert edit["start_point"] == (1, 7)
+        assert edit["new_end_point"] == (1, 8)
+
+    def test_deletion_at_end(self):
+        edit = compute_edit(b"aaa", b"aa")
+
+        assert (edit["start_byte"], edit["old_end_byte"], edit["new_end_byte"]) == (2, 3, 2)
+
+    def test_identical_sources_give_empty_edit(self):
+        edit = compute_edit(b"abc", b"abc")
+
+        assert edit["start_byte"] == edit["old_end_byte"] == edit["new_end_byte"] == 3